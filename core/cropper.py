@@ -4,9 +4,17 @@
 OpenCV + Pillow를 사용하여 아이돌 사진을  
 사용자 지정 규격에 맞게 자동 크롭합니다.
 원본 해상도와 DPI를 유지합니다.
+
+스레드 설정:
+    OpenCV는 기본적으로 연산마다 CPU 코어 수만큼 스레드를 사용합니다.
+    여러 이미지를 동시에 처리할 때는 configure_threading(작업 수)를 호출해
+    내부 스레드 수를 줄여야 코어 수의 제곱만큼 스레드가 생기지 않습니다.
+    PhotoCardCropper.process_batch는 이를 자동으로 처리하며,
+    단일 이미지 처리는 configure_threading(1)로 모든 코어를 사용합니다.
 """
 
 import cv2
+import json
 import numpy as np
 from PIL import Image
 from typing import Optional, Tuple, List, Dict, Any
@@ -14,6 +22,7 @@ import logging
 import sys
 import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -38,6 +47,21 @@ def get_resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+def configure_threading(outer_workers: int = 1) -> int:
+    """
+    바깥 병렬 작업 수에 맞춰 OpenCV 내부 스레드 수를 설정합니다.
+    
+    Args:
+        outer_workers: 동시에 실행되는 작업 수 (단일 이미지 처리는 1)
+        
+    Returns:
+        변경 전 OpenCV 스레드 수
+    """
+    previous = cv2.getNumThreads()
+    cv2.setNumThreads(max(1, (os.cpu_count() or 1) // max(1, outer_workers)))
+    return previous
+
+
 # 프리셋 규격 (가로mm x 세로mm)
 PRESET_SIZES = {
     '포토카드': (55, 85),
@@ -57,14 +81,36 @@ PRESET_SIZES = {
 class FaceDetector:
     """OpenCV 기반 얼굴 감지 클래스"""
     
+    __slots__ = ('face_cascade', 'eye_cascade')
+    
     # Haar Cascade 파일명
     FACE_CASCADE_FILE = "haarcascade_frontalface_default.xml"
     EYE_CASCADE_FILE = "haarcascade_eye.xml"
     
+    # 얼굴 감지용 축소 이미지의 목표 최대 변 길이 (px, MAX_DETECTION_FACTOR 제한이 우선)
+    DETECTION_MAX_SIDE = 1000
+    
+    # 원본 기준 최소 얼굴 크기 (px)와 Haar 얼굴 모델의 감지 창 크기 (px)
+    MIN_FACE_SIZE = 50
+    HAAR_WINDOW_SIZE = 24
+    
+    # 축소 후 최소 얼굴이 감지 창보다 작아지면 놓치므로 축소 배율 상한 (50 // 24 = 2)
+    MAX_DETECTION_FACTOR = MIN_FACE_SIZE // HAAR_WINDOW_SIZE
+    
+    # 눈 감지를 수행할 최소 얼굴 높이 (px)
+    MIN_FACE_HEIGHT_FOR_EYES = 120
+    
+    # Haar 피라미드 배율 (클수록 스캔하는 단계 수가 줄어들지만 놓치는 얼굴이 늘어남)
+    # 기본값은 기존 검출률을 유지하는 1.1, 더 큰 값은 사용자가 직접 선택
+    DEFAULT_SCALE_FACTOR = 1.1
+    
+    # 해석된 모델 파일 경로 (클래스 단위로 한 번만 탐색)
+    _FACE_PATH: Optional[str] = None
+    _EYE_PATH: Optional[str] = None
+    
     def __init__(self):
         # Haar Cascade 파일 경로 결정
-        face_cascade_path = self._find_cascade_file(self.FACE_CASCADE_FILE)
-        eye_cascade_path = self._find_cascade_file(self.EYE_CASCADE_FILE)
+        face_cascade_path, eye_cascade_path = self._resolve_paths()
         
         logger.info(f"Haar Cascade 경로: {face_cascade_path}")
         
@@ -76,7 +122,16 @@ class FaceDetector:
         
         logger.info("FaceDetector 초기화 완료 (Haar Cascade)")
     
-    def _find_cascade_file(self, filename: str) -> str:
+    @classmethod
+    def _resolve_paths(cls) -> Tuple[str, str]:
+        """얼굴/눈 Cascade 경로를 최초 호출 시에만 탐색해 캐시합니다."""
+        if cls._FACE_PATH is None:
+            cls._FACE_PATH = cls._find_cascade_file(cls.FACE_CASCADE_FILE)
+            cls._EYE_PATH = cls._find_cascade_file(cls.EYE_CASCADE_FILE)
+        return cls._FACE_PATH, cls._EYE_PATH
+    
+    @staticmethod
+    def _find_cascade_file(filename: str) -> str:
         """
         Haar Cascade 파일을 찾습니다.
         PyInstaller 빌드 환경과 개발 환경 모두 지원합니다.
@@ -104,26 +159,147 @@ class FaceDetector:
         # 찾지 못한 경우 기본 OpenCV 경로 반환 (오류 메시지용)
         return cv2_path
     
-    def detect_faces(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    def detect_faces(
+        self,
+        image: np.ndarray,
+        use_opencl: bool = False,
+        scale_factor: float = DEFAULT_SCALE_FACTOR,
+        equalize_hist: bool = False
+    ) -> List[Tuple[int, int, int, int]]:
+        faces, _ = self.detect_faces_with_gray(image, use_opencl, scale_factor, equalize_hist)
+        return [tuple(int(v) for v in face) for face in faces]
+    
+    def detect_faces_with_gray(
+        self,
+        image: np.ndarray,
+        use_opencl: bool = False,
+        scale_factor: float = DEFAULT_SCALE_FACTOR,
+        equalize_hist: bool = False
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        얼굴을 감지하고, 감지에 사용한 흑백 이미지가 원본 해상도이면 함께 반환합니다.
+        
+        얼굴은 (N, 4) int32 배열(x, y, w, h)로 반환합니다.
+        반환된 흑백 이미지는 눈 감지에 재사용할 수 있습니다 (축소 감지 시 None).
+        equalize_hist는 역광/저대비 사진의 Haar 검출률을 높입니다.
+        """
+        # 고해상도 원본은 정수 배율로 축소 후 감지 (Haar 피라미드 비용은 픽셀 수에 비례)
+        img_h, img_w = image.shape[:2]
+        # 배율 상한 덕분에 원본 기준 50px 얼굴까지 감지 (축소 후 min_size >= 24)
+        factor = min(
+            self._reduction_factor(img_w, img_h, self.DETECTION_MAX_SIDE),
+            self.MAX_DETECTION_FACTOR
+        )
+        min_size = self.MIN_FACE_SIZE // factor
+        image, dsize = self._trim_for_reduction(image, img_w, img_h, factor)
+        
+        faces = None
+        gray = None
+        if use_opencl and cv2.ocl.useOpenCL():
+            try:
+                # OpenCL(T-API) 경로: 축소/흑백 변환/감지를 GPU에서 수행, 사각형만 호스트로 복사
+                faces, _ = self._detect_in(
+                    cv2.UMat(image), dsize, min_size, scale_factor, equalize_hist
+                )
+            except cv2.error as e:
+                logger.warning(f"OpenCL 얼굴 감지 실패, CPU로 전환: {e}")
+                cv2.ocl.setUseOpenCL(False)
+        
+        if faces is None:
+            faces, gray = self._detect_in(
+                image, dsize, min_size, scale_factor, equalize_hist
+            )
+        
+        # 원본 좌표계로 복원 (감지 결과가 없으면 빈 튜플이 오므로 (0, 4) 배열로 정규화)
+        faces = np.asarray(faces, dtype=np.int32).reshape(-1, 4)
+        if factor > 1:
+            faces = faces * factor
+        return faces, (gray if factor == 1 else None)
+    
+    @staticmethod
+    def _reduction_factor(img_w: int, img_h: int, max_side: int) -> int:
+        """긴 변이 max_side 이하가 되는 가장 작은 정수 축소 배율"""
+        return max(1, -(-max(img_w, img_h) // max_side))
+    
+    @staticmethod
+    def _trim_for_reduction(
+        image: np.ndarray,
+        img_w: int,
+        img_h: int,
+        factor: int
+    ) -> Tuple[np.ndarray, Optional[Tuple[int, int]]]:
+        """
+        정수 배율 축소를 위해 배율로 나누어떨어지도록 오른쪽/아래 가장자리를 잘라낸 뷰와
+        축소 크기를 반환합니다 (축소가 필요 없으면 (image, None)).
+        
+        INTER_AREA는 정수 배율일 때 블록 평균 fast path를 사용하므로
+        임의 배율보다 2배 이상 빠릅니다. 버려지는 가장자리는 최대 factor-1 픽셀입니다.
+        """
+        if factor == 1:
+            return image, None
+        
+        dst_w = img_w // factor
+        dst_h = img_h // factor
+        return image[:dst_h * factor, :dst_w * factor], (dst_w, dst_h)
+    
+    def _detect_in(
+        self,
+        image,
+        dsize: Optional[Tuple[int, int]],
+        min_size: int,
+        scale_factor: float,
+        equalize_hist: bool
+    ):
+        """축소 + 흑백 변환 후 Haar Cascade 실행 (np.ndarray / cv2.UMat 공용)"""
+        if dsize is not None:
+            image = cv2.resize(image, dsize, interpolation=cv2.INTER_AREA)
+        
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # 눈 감지용으로 돌려주는 흑백 이미지는 평활화하지 않은 원본 유지
+        detect_gray = cv2.equalizeHist(gray) if equalize_hist else gray
         faces = self.face_cascade.detectMultiScale(
-            gray, scaleFactor=1.1, minNeighbors=5,
-            minSize=(50, 50), flags=cv2.CASCADE_SCALE_IMAGE
+            detect_gray, scaleFactor=scale_factor, minNeighbors=5,
+            minSize=(min_size, min_size), flags=cv2.CASCADE_SCALE_IMAGE
         )
-        return [(x, y, w, h) for (x, y, w, h) in faces]
+        return faces, gray
     
-    def detect_eyes_in_face(self, image: np.ndarray, face_bbox: Tuple[int, int, int, int]) -> List[Tuple[int, int, int, int]]:
+    def detect_eyes_in_face(
+        self,
+        image: np.ndarray,
+        face_bbox: Tuple[int, int, int, int],
+        gray: Optional[np.ndarray] = None
+    ) -> List[Tuple[int, int, int, int]]:
         x, y, w, h = face_bbox
-        face_upper = image[y:y + h // 2, x:x + w]
-        gray_upper = cv2.cvtColor(face_upper, cv2.COLOR_BGR2GRAY)
+        if gray is not None:
+            # 얼굴 감지 때 만든 원본 해상도 흑백 이미지 재사용
+            gray_upper = gray[y:y + h // 2, x:x + w]
+        else:
+            face_upper = image[y:y + h // 2, x:x + w]
+            gray_upper = cv2.cvtColor(face_upper, cv2.COLOR_BGR2GRAY)
         eyes = self.eye_cascade.detectMultiScale(
             gray_upper, scaleFactor=1.1, minNeighbors=5, minSize=(20, 20)
         )
         return [(ex + x, ey + y, ew, eh) for (ex, ey, ew, eh) in eyes]
     
-    def get_eye_center(self, image: np.ndarray, face_bbox: Tuple[int, int, int, int]) -> Tuple[int, int]:
+    @staticmethod
+    def estimate_eye_center(face_bbox: Tuple[int, int, int, int]) -> Tuple[int, int]:
+        """얼굴 영역 비율로 눈 중심을 추정 (눈 감지 없이)"""
+        x, y, w, h = face_bbox
+        return (x + w // 2, y + int(h * 0.35))
+    
+    def get_eye_center(
+        self,
+        image: np.ndarray,
+        face_bbox: Tuple[int, int, int, int],
+        gray: Optional[np.ndarray] = None
+    ) -> Tuple[int, int]:
         x, y, w, h = face_bbox
-        eyes = self.detect_eyes_in_face(image, face_bbox)
+        
+        # 작은 얼굴은 눈 감지가 불안정하므로 비율 추정값 사용
+        if h < self.MIN_FACE_HEIGHT_FOR_EYES:
+            return self.estimate_eye_center(face_bbox)
+            
+        eyes = self.detect_eyes_in_face(image, face_bbox, gray)
         
         if len(eyes) >= 2:
             eye_centers = [(ex + ew // 2, ey + eh // 2) for (ex, ey, ew, eh) in eyes[:2]]
@@ -134,9 +310,47 @@ class FaceDetector:
             ex, ey, ew, eh = eyes[0]
             return (ex + ew // 2, ey + eh // 2)
         else:
-            center_x = x + w // 2
-            center_y = y + int(h * 0.35)
-            return (center_x, center_y)
+            return self.estimate_eye_center(face_bbox)
+
+
+# FaceDetector 싱글톤 (Haar Cascade XML은 프로세스당 한 번만 로드)
+_face_detector_singleton: Optional[FaceDetector] = None
+
+
+def _get_face_detector() -> FaceDetector:
+    """공유 FaceDetector 인스턴스를 반환합니다 (최초 호출 시 생성)."""
+    global _face_detector_singleton
+    if _face_detector_singleton is None:
+        _face_detector_singleton = FaceDetector()
+    return _face_detector_singleton
+
+
+def _compute_pad_bounds(
+    img_height: int,
+    img_width: int,
+    crop_x: int,
+    crop_y: int,
+    crop_width: int,
+    crop_height: int
+) -> Tuple[int, int, int, int, int, int, int, int]:
+    """
+    크롭 영역의 패딩 크기와 원본과 겹치는 영역을 계산합니다.
+    
+    Returns:
+        (pad_left, pad_top, pad_right, pad_bottom, src_x1, src_y1, src_x2, src_y2)
+    """
+    crop_x2 = crop_x + crop_width
+    crop_y2 = crop_y + crop_height
+    return (
+        -crop_x if crop_x < 0 else 0,
+        -crop_y if crop_y < 0 else 0,
+        crop_x2 - img_width if crop_x2 > img_width else 0,
+        crop_y2 - img_height if crop_y2 > img_height else 0,
+        crop_x if crop_x > 0 else 0,
+        crop_y if crop_y > 0 else 0,
+        crop_x2 if crop_x2 < img_width else img_width,
+        crop_y2 if crop_y2 < img_height else img_height,
+    )
 
 
 class PhotoCardCropper:
@@ -146,10 +360,23 @@ class PhotoCardCropper:
     원본 해상도와 DPI를 유지하면서 사용자 지정 비율로 크롭합니다.
     """
     
+    # 속성 접근을 dict 조회 대신 슬롯 디스크립터로 처리
+    __slots__ = (
+        'zoom_factor', 'eye_position', 'width_mm', 'height_mm', 'padding_mode',
+        'fallback_on_no_face', 'preserve_resolution', 'min_output_height',
+        'offset_x', 'offset_y', 'use_eye_detection', 'scale_factor', 'equalize_hist',
+        'use_opencl', 'aspect_ratio', 'default_output_width', 'default_output_height',
+        'face_detector', 'use_face_cache', '_face_cache'
+    )
+    
     # 기본 규격: 포토카드 55x85mm
     DEFAULT_WIDTH_MM = 55
     DEFAULT_HEIGHT_MM = 85
     
+    # 얼굴 감지 결과 캐시 파일 이름 (출력 폴더에 저장)
+    FACE_CACHE_FILENAME = '.face_cache.json'
+    FACE_CACHE_VERSION = 1
+    
     def __init__(
         self,
         zoom_factor: float = 2.8,
@@ -161,7 +388,12 @@ class PhotoCardCropper:
         preserve_resolution: bool = True,
         min_output_height: int = 850,
         offset_x: float = 0.0,
-        offset_y: float = 0.0
+        offset_y: float = 0.0,
+        use_eye_detection: bool = True,
+        use_opencl: bool = False,
+        scale_factor: float = FaceDetector.DEFAULT_SCALE_FACTOR,
+        equalize_hist: bool = False,
+        use_face_cache: bool = True
     ):
         """
         PhotoCardCropper 초기화
@@ -177,6 +409,11 @@ class PhotoCardCropper:
             min_output_height: 최소 출력 높이 (픽셀)
             offset_x: 좌우 오프셋 비율 (-0.5 ~ 0.5, 음수: 왼쪽, 양수: 오른쪽)
             offset_y: 상하 오프셋 비율 (-0.5 ~ 0.5, 음수: 위, 양수: 아래)
+            use_eye_detection: False면 눈 감지 없이 얼굴 비율로 눈 위치 추정
+            use_opencl: True면 OpenCL 지원 시 얼굴 감지를 GPU(T-API)로 수행
+            scale_factor: Haar 얼굴 감지 피라미드 배율 (기본값: 1.1)
+            equalize_hist: True면 얼굴 감지 전 히스토그램 평활화 적용
+            use_face_cache: True면 (경로, 수정 시각, 크기)가 같은 파일은 얼굴 감지 결과 재사용
         """
         self.zoom_factor = zoom_factor
         self.eye_position = eye_position
@@ -188,6 +425,18 @@ class PhotoCardCropper:
         self.min_output_height = min_output_height
         self.offset_x = offset_x
         self.offset_y = offset_y
+        self.use_eye_detection = use_eye_detection
+        self.scale_factor = scale_factor
+        self.equalize_hist = equalize_hist
+        self.use_face_cache = use_face_cache
+        
+        # 절대 경로 -> (수정 시각 ns, 파일 크기, 얼굴 감지 결과)
+        self._face_cache: Dict[str, Tuple[int, int, Optional[Tuple[int, int, int, int, Tuple[int, int]]]]] = {}
+        
+        # OpenCL 미지원 환경에서는 조용히 CPU 경로 사용
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
         
         # 비율 계산
         self.aspect_ratio = width_mm / height_mm
@@ -196,7 +445,7 @@ class PhotoCardCropper:
         self.default_output_width = int(width_mm * 10)
         self.default_output_height = int(height_mm * 10)
         
-        self.face_detector = FaceDetector()
+        self.face_detector = _get_face_detector()
         
         logger.info(
             f"PhotoCardCropper 초기화 완료 - "
@@ -214,43 +463,144 @@ class PhotoCardCropper:
         logger.info(f"규격 변경: {width_mm}x{height_mm}mm (비율: {self.aspect_ratio:.3f})")
     
     def _detect_largest_face(self, image: np.ndarray) -> Optional[Tuple[int, int, int, int, Tuple[int, int]]]:
-        faces = self.face_detector.detect_faces(image)
-        if not faces:
+        faces, gray = self.face_detector.detect_faces_with_gray(
+            image,
+            use_opencl=self.use_opencl,
+            scale_factor=self.scale_factor,
+            equalize_hist=self.equalize_hist
+        )
+        if len(faces) == 0:
             return None
         
-        largest_face = max(faces, key=lambda f: f[2] * f[3])
-        x, y, w, h = largest_face
-        eye_center = self.face_detector.get_eye_center(image, largest_face)
+        areas = faces[:, 2] * faces[:, 3]
+        x, y, w, h = map(int, faces[int(np.argmax(areas))])
+        largest_face = (x, y, w, h)
+        if self.use_eye_detection:
+            eye_center = self.face_detector.get_eye_center(image, largest_face, gray)
+        else:
+            eye_center = self.face_detector.estimate_eye_center(largest_face)
         return (x, y, w, h, eye_center)
     
-    def _calculate_crop_region(
+    def _face_cache_key(self, image_path: str) -> Optional[Tuple[str, int, int]]:
+        """얼굴 감지 캐시 키 (절대 경로, 수정 시각 ns, 파일 크기), 캐시 미사용/stat 실패 시 None"""
+        if not self.use_face_cache:
+            return None
+        try:
+            st = os.stat(image_path)
+        except OSError:
+            return None
+        return os.path.abspath(image_path), st.st_mtime_ns, st.st_size
+    
+    def _detect_largest_face_cached(
         self,
         image: np.ndarray,
-        face_bbox: Tuple[int, int, int, int],
+        cache_key: Optional[Tuple[str, int, int]]
+    ) -> Optional[Tuple[int, int, int, int, Tuple[int, int]]]:
+        """같은 파일(수정 시각/크기 일치)이면 이전 감지 결과를 재사용 (미감지 결과 포함)"""
+        if cache_key is None:
+            return self._detect_largest_face(image)
+        
+        path, mtime_ns, size = cache_key
+        cached = self._face_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+            logger.info(f"얼굴 감지 캐시 사용: {path}")
+            return cached[2]
+        
+        face_result = self._detect_largest_face(image)
+        self._face_cache[path] = (mtime_ns, size, face_result)
+        return face_result
+    
+    def _face_cache_settings(self) -> list:
+        """감지 결과에 영향을 주는 설정 (다르면 저장된 캐시를 사용하지 않음)"""
+        return [self.scale_factor, self.equalize_hist, self.use_eye_detection]
+    
+    def load_face_cache(self, cache_path: str) -> int:
+        """
+        저장된 얼굴 감지 결과 불러오기
+        
+        감지 설정이 다르거나 파일이 없거나 항목 하나라도 형식이 잘못되면 아무것도 불러오지 않습니다.
+        
+        Returns:
+            불러온 항목 수
+        """
+        if not self.use_face_cache or not os.path.exists(cache_path):
+            return 0
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.FACE_CACHE_VERSION or data.get('settings') != self._face_cache_settings():
+                logger.info("얼굴 감지 설정이 달라 캐시를 사용하지 않음")
+                return 0
+            
+            # 전체를 먼저 검증한 뒤 한 번에 병합 (중간에 실패하면 일부만 쓰이지 않게)
+            loaded = {}
+            for path, (mtime_ns, size, face) in data['entries'].items():
+                if face is not None:
+                    x, y, w, h, eye_x, eye_y = (int(v) for v in face)
+                    face = (x, y, w, h, (eye_x, eye_y))
+                loaded[str(path)] = (int(mtime_ns), int(size), face)
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"얼굴 감지 캐시 로드 실패 ({cache_path}): {e}")
+            return 0
+        
+        for path, entry in loaded.items():
+            self._face_cache.setdefault(path, entry)
+        
+        logger.info(f"얼굴 감지 캐시 로드: {len(loaded)}개 ({cache_path})")
+        return len(loaded)
+    
+    def save_face_cache(self, cache_path: str) -> bool:
+        """얼굴 감지 결과를 JSON으로 저장 (임시 파일에 쓴 뒤 교체, 삭제/이동된 파일 항목은 제외)"""
+        if not self.use_face_cache or not self._face_cache:
+            return False
+        
+        entries = {}
+        for path, (mtime_ns, size, face) in list(self._face_cache.items()):
+            if not os.path.exists(path):
+                continue
+            if face is not None:
+                x, y, w, h, (eye_x, eye_y) = face
+                face = [int(x), int(y), int(w), int(h), int(eye_x), int(eye_y)]
+            entries[path] = [mtime_ns, size, face]
+        
+        data = {
+            'version': self.FACE_CACHE_VERSION,
+            'settings': self._face_cache_settings(),
+            'entries': entries
+        }
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+            return True
+        except OSError as e:
+            logger.warning(f"얼굴 감지 캐시 저장 실패 ({cache_path}): {e}")
+            return False
+    
+    @staticmethod
+    def _calculate_crop_region(
+        face_height: int,
         eye_center: Tuple[int, int],
-        offset_x: Optional[float] = None,
-        offset_y: Optional[float] = None
+        *,
+        zoom: float,
+        eye_pos: float,
+        aspect: float,
+        off_x: float,
+        off_y: float
     ) -> Tuple[int, int, int, int]:
-        face_x, face_y, face_w, face_h = face_bbox
         eye_center_x, eye_center_y = eye_center
         
-        # 오프셋 값 결정
-        off_x = offset_x if offset_x is not None else self.offset_x
-        off_y = offset_y if offset_y is not None else self.offset_y
-        
         # 얼굴 크기를 기준으로 크롭 영역 크기 계산
-        crop_height = int(face_h * self.zoom_factor)
-        crop_width = int(crop_height * self.aspect_ratio)
+        crop_height = int(face_height * zoom)
+        crop_width = int(crop_height * aspect)
         
-        # 눈의 위치가 eye_position 비율에 오도록 y 좌표 계산
-        crop_y = eye_center_y - int(crop_height * self.eye_position)
-        crop_x = eye_center_x - crop_width // 2
-        
-        # 사용자 오프셋 적용 (비율 기반)
+        # 눈이 가로 중앙, 세로 eye_pos 비율에 오도록 배치한 뒤 사용자 오프셋(비율 기반) 적용
         # offset_x: 양수면 오른쪽으로 이동 (이미지가 왼쪽으로 이동하는 효과)
         # offset_y: 양수면 아래로 이동 (이미지가 위로 이동하는 효과)
-        crop_x += int(crop_width * off_x)
-        crop_y += int(crop_height * off_y)
+        crop_x = eye_center_x - (crop_width >> 1) + int(crop_width * off_x)
+        crop_y = eye_center_y - int(crop_height * eye_pos) + int(crop_height * off_y)
         
         return crop_x, crop_y, crop_width, crop_height
     
@@ -258,9 +608,35 @@ class PhotoCardCropper:
         if self.padding_mode == 'white':
             return (255, 255, 255)
         elif self.padding_mode == 'average':
+            return self._border_mean_color(image)
+        return (255, 255, 255)
+    
+    @staticmethod
+    def _border_mean_color(image: np.ndarray) -> Tuple[int, int, int]:
+        """
+        이미지 가장자리 띠(짧은 변의 약 2%)의 평균 색상
+        
+        패딩 영역은 배경과 이어지므로 전체 평균 대신 가장자리만 읽습니다.
+        """
+        img_height, img_width = image.shape[:2]
+        k = max(8, min(img_height, img_width) // 50)
+        
+        if 2 * k >= min(img_height, img_width):
             avg_color = cv2.mean(image)[:3]
             return tuple(int(c) for c in avg_color)
-        return (255, 255, 255)
+        
+        strips = (
+            image[:k],
+            image[-k:],
+            image[k:-k, :k],
+            image[k:-k, -k:],
+        )
+        total = np.zeros(3)
+        count = 0
+        for strip in strips:
+            total += cv2.sumElems(strip)[:3]
+            count += strip.shape[0] * strip.shape[1]
+        return tuple(int(c) for c in total / count)
     
     def _crop_with_padding(
         self,
@@ -271,45 +647,62 @@ class PhotoCardCropper:
         crop_height: int
     ) -> np.ndarray:
         img_height, img_width = image.shape[:2]
-        padding_color = self._get_padding_color(image)
+        (pad_left, pad_top, pad_right, pad_bottom,
+         src_x1, src_y1, src_x2, src_y2) = _compute_pad_bounds(
+            img_height, img_width, crop_x, crop_y, crop_width, crop_height
+        )
+        
+        if not (pad_left or pad_top or pad_right or pad_bottom):
+            # 원본 안쪽 영역은 복사 없이 뷰 반환 (cv2.resize 등은 뷰를 그대로 읽음)
+            return image[crop_y:crop_y + crop_height, crop_x:crop_x + crop_width]
         
         if self.padding_mode == 'mirror':
-            pad_left = max(0, -crop_x)
-            pad_top = max(0, -crop_y)
-            pad_right = max(0, (crop_x + crop_width) - img_width)
-            pad_bottom = max(0, (crop_y + crop_height) - img_height)
+            # 반사에 필요한 원본 픽셀까지 포함하도록 ROI 확장
+            ext_x1 = min(src_x1, max(0, img_width - 1 - pad_right))
+            ext_y1 = min(src_y1, max(0, img_height - 1 - pad_bottom))
+            ext_x2 = max(src_x2, min(img_width, pad_left + 1))
+            ext_y2 = max(src_y2, min(img_height, pad_top + 1))
             
-            if pad_left > 0 or pad_top > 0 or pad_right > 0 or pad_bottom > 0:
-                image = cv2.copyMakeBorder(
-                    image, pad_top, pad_bottom, pad_left, pad_right,
-                    cv2.BORDER_REFLECT_101
-                )
-                crop_x += pad_left
-                crop_y += pad_top
+            padded = cv2.copyMakeBorder(
+                image[ext_y1:ext_y2, ext_x1:ext_x2],
+                pad_top, pad_bottom, pad_left, pad_right,
+                cv2.BORDER_REFLECT_101
+            )
+            off_x = src_x1 - ext_x1
+            off_y = src_y1 - ext_y1
+            return padded[off_y:off_y + crop_height, off_x:off_x + crop_width]
             
-            cropped = image[crop_y:crop_y + crop_height, crop_x:crop_x + crop_width]
-        else:
-            cropped = np.full((crop_height, crop_width, 3), padding_color, dtype=np.uint8)
-            
-            src_x1 = max(0, crop_x)
-            src_y1 = max(0, crop_y)
-            src_x2 = min(img_width, crop_x + crop_width)
-            src_y2 = min(img_height, crop_y + crop_height)
-            
-            dst_x1 = src_x1 - crop_x
-            dst_y1 = src_y1 - crop_y
-            dst_x2 = dst_x1 + (src_x2 - src_x1)
-            dst_y2 = dst_y1 + (src_y2 - src_y1)
+        padding_color = self._get_padding_color(image)
+        
+        if src_x2 <= src_x1 or src_y2 <= src_y1:
+            # 겹치는 영역이 없으면 단색 캔버스
+            return np.full((crop_height, crop_width, 3), padding_color, dtype=np.uint8)
             
-            if src_x2 > src_x1 and src_y2 > src_y1:
-                cropped[dst_y1:dst_y2, dst_x1:dst_x2] = image[src_y1:src_y2, src_x1:src_x2]
+        # 채우기와 복사를 OpenCV 한 번의 패스로 처리
+        return cv2.copyMakeBorder(
+            image[src_y1:src_y2, src_x1:src_x2],
+            pad_top, pad_bottom, pad_left, pad_right,
+            cv2.BORDER_CONSTANT, value=padding_color
+        )
+    
+    @staticmethod
+    def _select_interpolation(src_w: int, src_h: int, dst_w: int, dst_h: int) -> int:
+        """
+        리사이즈 방향에 맞는 보간법 선택
         
-        return cropped
+        축소는 INTER_AREA, 2배 미만 확대는 INTER_CUBIC,
+        그 이상의 확대에만 INTER_LANCZOS4를 사용합니다.
+        """
+        if dst_w * dst_h < src_w * src_h:
+            return cv2.INTER_AREA
+        if dst_h < src_h * 2:
+            return cv2.INTER_CUBIC
+        return cv2.INTER_LANCZOS4
     
-    def _center_crop_fallback(self, image: np.ndarray) -> np.ndarray:
+    def _center_crop_region(self, image: np.ndarray, aspect: float) -> Tuple[int, int, int, int]:
         img_height, img_width = image.shape[:2]
         
-        target_ratio = self.aspect_ratio
+        target_ratio = aspect
         current_ratio = img_width / img_height
         
         if current_ratio > target_ratio:
@@ -322,7 +715,41 @@ class PhotoCardCropper:
         crop_x = (img_width - crop_width) // 2
         crop_y = (img_height - crop_height) // 2
         
-        return self._crop_with_padding(image, crop_x, crop_y, crop_width, crop_height)
+        return crop_x, crop_y, crop_width, crop_height
+    
+    def _render_output(
+        self,
+        image: np.ndarray,
+        crop_x: int,
+        crop_y: int,
+        crop_width: int,
+        crop_height: int,
+        interpolation: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        크롭 영역을 출력 크기의 이미지로 변환
+        
+        크롭 영역이 원본 안에 있으면 중간 버퍼 없이 원본 뷰에서 바로 리샘플링합니다.
+        interpolation을 지정하면 자동 선택 대신 해당 보간법을 사용합니다.
+        """
+        cropped = self._crop_with_padding(image, crop_x, crop_y, crop_width, crop_height)
+        
+        if self.preserve_resolution:
+            if crop_height >= self.min_output_height:
+                # 결과가 원본 전체 버퍼를 붙잡지 않도록 원본 뷰는 복사
+                return cropped.copy() if np.may_share_memory(cropped, image) else cropped
+            
+            scale = self.min_output_height / crop_height
+            new_w = int(crop_width * scale)
+            new_h = self.min_output_height
+        else:
+            new_w = self.default_output_width
+            new_h = self.default_output_height
+        
+        if interpolation is None:
+            interpolation = self._select_interpolation(crop_width, crop_height, new_w, new_h)
+        
+        return cv2.resize(cropped, (new_w, new_h), interpolation=interpolation)
     
     def _load_image_with_metadata(self, image_path: str) -> Tuple[Optional[np.ndarray], Dict[str, Any]]:
         """이미지와 메타데이터(DPI 등)를 함께 로드"""
@@ -333,26 +760,31 @@ class PhotoCardCropper:
         }
         
         try:
-            pil_image = Image.open(image_path)
-            
-            if 'dpi' in pil_image.info:
-                metadata['dpi'] = pil_image.info['dpi']
-            elif hasattr(pil_image, '_getexif') and pil_image._getexif():
-                exif = pil_image._getexif()
-                if exif and 282 in exif and 283 in exif:
-                    metadata['dpi'] = (exif[282], exif[283])
-            
-            if hasattr(pil_image, 'info') and 'exif' in pil_image.info:
-                metadata['exif'] = pil_image.info['exif']
-            
-            if 'icc_profile' in pil_image.info:
-                metadata['icc_profile'] = pil_image.info['icc_profile']
-            
-            if pil_image.mode == 'RGBA':
-                pil_image = pil_image.convert('RGB')
-            
-            image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-            
+            with Image.open(image_path) as pil_image:
+                if 'dpi' in pil_image.info:
+                    metadata['dpi'] = pil_image.info['dpi']
+                elif hasattr(pil_image, '_getexif') and pil_image._getexif():
+                    exif = pil_image._getexif()
+                    if exif and 282 in exif and 283 in exif:
+                        metadata['dpi'] = (exif[282], exif[283])
+                
+                if hasattr(pil_image, 'info') and 'exif' in pil_image.info:
+                    metadata['exif'] = pil_image.info['exif']
+                
+                if 'icc_profile' in pil_image.info:
+                    metadata['icc_profile'] = pil_image.info['icc_profile']
+                    
+                # 픽셀 데이터는 OpenCV로 직접 BGR 디코딩 (PIL은 메타데이터만 읽음)
+                if pil_image.mode == 'RGBA':
+                    image = self._decode_with_pil(pil_image)
+                else:
+                    image = cv2.imdecode(
+                        np.fromfile(image_path, dtype=np.uint8),
+                        cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION
+                    )
+                    if image is None:
+                        image = self._decode_with_pil(pil_image)
+                        
             logger.info(f"DPI 정보: {metadata['dpi']}")
             
             return image, metadata
@@ -361,6 +793,16 @@ class PhotoCardCropper:
             logger.error(f"이미지 로드 실패: {e}")
             return None, metadata
     
+    @staticmethod
+    def _decode_with_pil(pil_image: Image.Image) -> np.ndarray:
+        """OpenCV가 처리하지 못하는 이미지를 PIL로 디코딩하여 BGR 배열로 변환"""
+        if pil_image.mode == 'RGBA':
+            # PIL의 RGBA -> RGB 변환은 알파를 버리기만 하므로 cvtColor 한 번으로 대체
+            return cv2.cvtColor(np.asarray(pil_image), cv2.COLOR_RGBA2BGR)
+        if pil_image.mode != 'RGB':
+            pil_image = pil_image.convert('RGB')
+        return cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+    
     def process_image(
         self,
         image_path: str,
@@ -394,21 +836,14 @@ class PhotoCardCropper:
         
         # 규격 오버라이드
         if width_mm is not None and height_mm is not None:
-            original_aspect = self.aspect_ratio
-            self.aspect_ratio = width_mm / height_mm
+            aspect = width_mm / height_mm
         else:
-            original_aspect = None
-        
-        original_zoom = self.zoom_factor
-        original_eye_pos = self.eye_position
-        original_offset_x = self.offset_x
-        original_offset_y = self.offset_y
-        self.zoom_factor = zoom
-        self.eye_position = eye_pos
-        self.offset_x = off_x
-        self.offset_y = off_y
+            aspect = self.aspect_ratio
         
+        # 오버라이드 값은 self를 변경하지 않고 인자로 전달 (여러 스레드에서 동시 호출 가능)
         try:
+            # 로드 전에 파일 정보를 읽어 로드 중 변경되면 다음 실행에서 다시 감지
+            cache_key = self._face_cache_key(image_path)
             image, metadata = self._load_image_with_metadata(image_path)
             
             if image is None:
@@ -417,16 +852,16 @@ class PhotoCardCropper:
             
             img_height, img_width = image.shape[:2]
             logger.info(f"이미지 로드 완료: {image_path} ({img_width}x{img_height}, DPI: {metadata['dpi']})")
-            logger.info(f"출력 규격: {self.width_mm}x{self.height_mm}mm (비율: {self.aspect_ratio:.3f})")
+            logger.info(f"출력 규격: {self.width_mm}x{self.height_mm}mm (비율: {aspect:.3f})")
             
-            face_result = self._detect_largest_face(image)
+            face_result = self._detect_largest_face_cached(image, cache_key)
             
             if face_result is None:
                 logger.warning(f"얼굴 미감지: {image_path}")
                 
                 if self.fallback_on_no_face:
                     logger.info("폴백 모드: 중앙 크롭 적용")
-                    cropped = self._center_crop_fallback(image)
+                    crop_x, crop_y, crop_w, crop_h = self._center_crop_region(image, aspect)
                 else:
                     logger.info("스킵 모드: 처리 건너뜀")
                     return None
@@ -435,29 +870,13 @@ class PhotoCardCropper:
                 logger.info(f"얼굴 감지 완료 - 위치: ({face_x}, {face_y}), 크기: {face_w}x{face_h}")
                 
                 crop_x, crop_y, crop_w, crop_h = self._calculate_crop_region(
-                    image, (face_x, face_y, face_w, face_h), eye_center
+                    face_h, eye_center,
+                    zoom=zoom, eye_pos=eye_pos, aspect=aspect, off_x=off_x, off_y=off_y
                 )
                 
                 logger.info(f"크롭 영역 - 시작: ({crop_x}, {crop_y}), 크기: {crop_w}x{crop_h}")
-                
-                cropped = self._crop_with_padding(image, crop_x, crop_y, crop_w, crop_h)
             
-            if self.preserve_resolution:
-                crop_h, crop_w = cropped.shape[:2]
-                
-                if crop_h < self.min_output_height:
-                    scale = self.min_output_height / crop_h
-                    new_w = int(crop_w * scale)
-                    new_h = self.min_output_height
-                    result = cv2.resize(cropped, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
-                else:
-                    result = cropped
-            else:
-                result = cv2.resize(
-                    cropped,
-                    (self.default_output_width, self.default_output_height),
-                    interpolation=cv2.INTER_LANCZOS4
-                )
+            result = self._render_output(image, crop_x, crop_y, crop_w, crop_h)
             
             result_h, result_w = result.shape[:2]
             logger.info(f"처리 완료: {image_path} -> {result_w}x{result_h}")
@@ -467,85 +886,109 @@ class PhotoCardCropper:
         except Exception as e:
             logger.error(f"이미지 처리 중 오류 발생 ({image_path}): {str(e)}")
             return None
+    
+    def process_batch(
+        self,
+        image_paths: List[str],
+        max_workers: Optional[int] = None
+    ) -> List[Optional[Tuple[np.ndarray, Dict[str, Any]]]]:
+        """
+        여러 이미지를 스레드 풀로 병렬 처리
+        
+        OpenCV 연산은 GIL을 해제하므로 이미지 디코딩과 얼굴 감지가 겹쳐 실행됩니다.
+        처리 중에는 OpenCV 내부 스레드 수를 작업 스레드 수에 맞춰 줄입니다.
+        
+        Args:
+            image_paths: 이미지 파일 경로 목록
+            max_workers: 작업 스레드 수 (기본값: CPU 코어 수)
             
+        Returns:
+            입력 순서와 같은 순서의 process_image 결과 목록
+        """
+        workers = max_workers or os.cpu_count() or 1
+        logger.info(f"병렬 처리 시작: {len(image_paths)}개 이미지, {workers}개 스레드")
+        
+        previous_threads = configure_threading(workers)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(self.process_image, [str(p) for p in image_paths]))
         finally:
-            self.zoom_factor = original_zoom
-            self.eye_position = original_eye_pos
-            self.offset_x = original_offset_x
-            self.offset_y = original_offset_y
-            if original_aspect is not None:
-                self.aspect_ratio = original_aspect
+            cv2.setNumThreads(previous_threads)
     
-    def process_image_from_array(
+    def detect_face(self, image: np.ndarray) -> Optional[Tuple[int, int, int, int, Tuple[int, int]]]:
+        """
+        가장 큰 얼굴과 눈 중심 감지
+        
+        결과는 zoom/eye/offset/비율과 무관하므로 같은 이미지에 대해 재사용할 수 있습니다.
+        
+        Returns:
+            (x, y, w, h, (eye_center_x, eye_center_y)) 또는 미감지 시 None
+        """
+        return self._detect_largest_face(image)
+    
+    def crop_with_box(
         self,
         image: np.ndarray,
+        face_box: Optional[Tuple[int, int, int, int, Tuple[int, int]]],
         zoom_factor: Optional[float] = None,
         eye_position: Optional[float] = None,
         offset_x: Optional[float] = None,
         offset_y: Optional[float] = None,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> Optional[Tuple[np.ndarray, Dict[str, Any]]]:
-        """numpy 배열로부터 직접 이미지 처리"""
+        interpolation: Optional[int] = None
+    ) -> Optional[np.ndarray]:
+        """
+        detect_face 결과로 크롭 (얼굴 감지 없이 기하 연산과 리사이즈만 수행)
+        
+        face_box가 None이면 fallback_on_no_face 설정에 따라 중앙 크롭하거나 None을 반환합니다.
+        interpolation은 출력 리사이즈 보간법 (기본값: 축소/확대에 맞춰 자동 선택)
+        """
         zoom = zoom_factor if zoom_factor is not None else self.zoom_factor
         eye_pos = eye_position if eye_position is not None else self.eye_position
         off_x = offset_x if offset_x is not None else self.offset_x
         off_y = offset_y if offset_y is not None else self.offset_y
+        aspect = self.aspect_ratio
         
+        if face_box is None:
+            if not self.fallback_on_no_face:
+                return None
+            crop_x, crop_y, crop_w, crop_h = self._center_crop_region(image, aspect)
+        else:
+            face_x, face_y, face_w, face_h, eye_center = face_box
+            crop_x, crop_y, crop_w, crop_h = self._calculate_crop_region(
+                face_h, eye_center,
+                zoom=zoom, eye_pos=eye_pos, aspect=aspect, off_x=off_x, off_y=off_y
+            )
+        
+        return self._render_output(image, crop_x, crop_y, crop_w, crop_h, interpolation)
+    
+    def process_image_from_array(
+        self,
+        image: np.ndarray,
+        zoom_factor: Optional[float] = None,
+        eye_position: Optional[float] = None,
+        offset_x: Optional[float] = None,
+        offset_y: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple[np.ndarray, Dict[str, Any]]]:
+        """numpy 배열로부터 직접 이미지 처리"""
         if metadata is None:
             metadata = {'dpi': (72, 72), 'exif': None, 'icc_profile': None}
         
-        original_zoom = self.zoom_factor
-        original_eye_pos = self.eye_position
-        original_offset_x = self.offset_x
-        original_offset_y = self.offset_y
-        self.zoom_factor = zoom
-        self.eye_position = eye_pos
-        self.offset_x = off_x
-        self.offset_y = off_y
-        
         try:
             if image is None or image.size == 0:
                 logger.error("유효하지 않은 이미지 배열")
                 return None
             
-            face_result = self._detect_largest_face(image)
-            
-            if face_result is None:
-                if self.fallback_on_no_face:
-                    cropped = self._center_crop_fallback(image)
-                else:
-                    return None
-            else:
-                face_x, face_y, face_w, face_h, eye_center = face_result
-                crop_x, crop_y, crop_w, crop_h = self._calculate_crop_region(
-                    image, (face_x, face_y, face_w, face_h), eye_center
-                )
-                cropped = self._crop_with_padding(image, crop_x, crop_y, crop_w, crop_h)
-            
-            if self.preserve_resolution:
-                crop_h, crop_w = cropped.shape[:2]
-                if crop_h < self.min_output_height:
-                    scale = self.min_output_height / crop_h
-                    new_w = int(crop_w * scale)
-                    new_h = self.min_output_height
-                    result = cv2.resize(cropped, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
-                else:
-                    result = cropped
-            else:
-                result = cv2.resize(
-                    cropped,
-                    (self.default_output_width, self.default_output_height),
-                    interpolation=cv2.INTER_LANCZOS4
-                )
+            result = self.crop_with_box(
+                image, self.detect_face(image),
+                zoom_factor=zoom_factor, eye_position=eye_position,
+                offset_x=offset_x, offset_y=offset_y
+            )
+            if result is None:
+                return None
             
             return result, metadata
             
         except Exception as e:
             logger.error(f"이미지 처리 중 오류: {str(e)}")
             return None
-            
-        finally:
-            self.zoom_factor = original_zoom
-            self.eye_position = original_eye_pos
-            self.offset_x = original_offset_x
-            self.offset_y = original_offset_y
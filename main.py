@@ -10,12 +10,15 @@ GUI: tkinter + ttk 기반 (macOS 호환)
 
 import os
 import sys
+import hashlib
 import threading
 import queue
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple, List
 
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, END
@@ -59,20 +62,48 @@ def setup_logging(log_queue: queue.Queue):
 class PhotoCardCropperApp:
     """포토카드 크롭 GUI 애플리케이션"""
     
-    # 프리셋 규격 (가로mm x 세로mm)
-    PRESET_SIZES = {
-        '포토카드 (55×85)': (55, 85),
-        '여권사진 (35×45)': (35, 45),
-        '증명사진 3×4 (30×40)': (30, 40),
-        '증명사진 4×5 (40×50)': (40, 50),
-        'ID카드 (54×86)': (54, 86),
-        '인스탁스 미니 (54×86)': (54, 86),
-        '인스탁스 스퀘어 (62×62)': (62, 62),
-        '폴라로이드 (79×79)': (79, 79),
-        '명함 가로 (90×50)': (90, 50),
-        '명함 세로 (50×90)': (50, 90),
-        '사용자 정의': (55, 85),
-    }
+    # 프리셋 규격 (이름, 가로mm, 세로mm, 비율 표시 문자열)
+    PRESETS = tuple(
+        (name, width, height, f"비율: {width}:{height} ({width / height:.3f})")
+        for name, width, height in (
+            ('포토카드 (55×85)', 55, 85),
+            ('여권사진 (35×45)', 35, 45),
+            ('증명사진 3×4 (30×40)', 30, 40),
+            ('증명사진 4×5 (40×50)', 40, 50),
+            ('ID카드 (54×86)', 54, 86),
+            ('인스탁스 미니 (54×86)', 54, 86),
+            ('인스탁스 스퀘어 (62×62)', 62, 62),
+            ('폴라로이드 (79×79)', 79, 79),
+            ('명함 가로 (90×50)', 90, 50),
+            ('명함 세로 (50×90)', 50, 90),
+            ('사용자 정의', 55, 85),
+        )
+    )
+    PRESET_BY_NAME = {preset[0]: preset for preset in PRESETS}
+    
+    # 미리보기 캔버스 크기 및 배경색
+    PREVIEW_CANVAS_SIZE = (280, 430)
+    PREVIEW_CANVAS_BG = (45, 45, 45, 255)  # '#2D2D2D'
+    
+    # 드래그 중 슬라이더가 이 시간(ms) 동안 멈추면 고화질로 다시 렌더링
+    PREVIEW_SETTLE_MS = 250
+    
+    # 미리보기 디코딩 캐시 최대 이미지 수
+    PREVIEW_CACHE_SIZE = 32
+    
+    # 미리보기용 축소본의 최대 변 길이 (px, 얼굴 감지 축소 기준과 동일)
+    PREVIEW_DRAFT_MAX_SIDE = 1000
+    
+    # 미리보기 축소본 디스크 캐시 (실행 간 재사용, 최근 사용 순으로 최대 개수 유지)
+    THUMB_CACHE_DIR = Path.home() / '.cache' / 'photocard_cropper' / 'thumbs'
+    THUMB_CACHE_MAX_FILES = 500
+    
+    # 로그 창에 유지할 최대 줄 수
+    LOG_MAX_LINES = 5000
+    
+    # 미리보기 폴더 탐색 제한: 최대 탐색 깊이 및 최대 이미지 수
+    PREVIEW_MAX_DEPTH = 5
+    PREVIEW_MAX_IMAGES = 1000
     
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -85,6 +116,8 @@ class PhotoCardCropperApp:
         self.output_dir: Optional[str] = None
         self.is_processing = False
         self.processing_thread: Optional[threading.Thread] = None
+        self._pending_progress: Optional[Tuple[int, int]] = None  # 작업 스레드가 기록한 최신 (완료 수, 전체 수)
+        self._shown_progress: Optional[Tuple[int, int]] = None  # 화면에 표시된 진행 상황
         
         # 크로퍼 (지연 로딩)
         self.cropper = None
@@ -95,13 +128,29 @@ class PhotoCardCropperApp:
         
         # 미리보기 관련
         self.preview_image_path: Optional[str] = None
-        self.preview_original_image: Optional[np.ndarray] = None
-        self.preview_photo_image: Optional[ImageTk.PhotoImage] = None
-        self.preview_update_job = None  # 디바운싱용
+        self.preview_draft_image: Optional[np.ndarray] = None  # 축소본 (원본은 변환 시 디스크에서 로드)
+        self._preview_draft_serial = 0  # 현재 축소본의 디코딩 번호 (id()는 해제 후 재사용될 수 있어 대신 사용)
+        self._draft_serial_counter = 0  # 축소본을 새로 디코딩할 때마다 증가
+        self._preview_inflight = False  # 렌더링 예약/진행 중 여부
+        self._preview_dirty = False  # 렌더링 중 설정 변경 여부
+        self._preview_generation = 0  # 캔버스를 비울 때마다 증가 (그 전에 시작된 렌더링 결과는 버림)
+        self._last_preview_key: Optional[tuple] = None  # 마지막으로 렌더링한 설정 (같으면 건너뜀)
+        self._dragging = False  # 슬라이더 드래그 중 여부 (미리보기 저화질 모드)
+        self._drag_settled = False  # 드래그 중 슬라이더가 멈춰 고화질로 렌더링할지 여부
+        self._preview_settle_job = None  # 드래그 멈춤 감지 예약 ID
+        # 슬라이더 값 (표시 단위로 반올림) - 같은 값이면 콜백을 건너뜀
+        self._last_zoom = 2.8
+        self._last_eye = 0.42
+        self._last_ox = 0
+        self._last_oy = 0
         self.preview_cropper = None
+        self._decode_cache: OrderedDict = OrderedDict()  # {이미지경로: (수정 시각, (축소본, 원본 크기), 디코딩 번호)} (LRU)
+        self._detection_cache: dict = {}  # {이미지경로: (축소본 디코딩 번호, 얼굴 감지 결과 (미감지 시 None))}
         
-        # 이미지별 오프셋 저장 {이미지경로: (offset_x, offset_y)}
+        # 이미지별 오프셋 저장 {파일 ID: (offset_x, offset_y)} (폴더 이름 변경/심볼릭 링크 경로에도 유지)
         self.image_offsets: dict = {}
+        self._nonzero_offset_count = 0  # 0이 아닌 오프셋을 가진 이미지 수
+        self._stat_cache: dict = {}  # {이미지경로: 파일 ID}
         
         # tkinter 변수
         self.zoom_var = tk.DoubleVar(value=2.8)
@@ -112,10 +161,22 @@ class PhotoCardCropperApp:
         self.width_var = tk.StringVar(value="55")
         self.height_var = tk.StringVar(value="85")
         self.preset_var = tk.StringVar(value="포토카드 (55×85)")
-        self._updating_from_preset = False  # 프리셋에서 값 업데이트 중 플래그
+        self._committed_size = (55.0, 85.0)  # 마지막으로 반영한 (가로mm, 세로mm)
+        self._size_commit_job = None  # 입력 멈춤 후 반영 예약 ID
         
         # 로그 큐
         self.log_queue = queue.Queue()
+        
+        # 창을 먼저 표시하고 나머지 초기화는 첫 화면 이후로 미룸
+        self._placeholder = ttk.Label(self.root, text="불러오는 중...")
+        self._placeholder.pack(expand=True)
+        self.root.update_idletasks()
+        self.root.after_idle(self._deferred_init)
+    
+    def _deferred_init(self):
+        """첫 화면 표시 후 나머지 초기화 (로깅, 스타일, 위젯, 모델 로딩)"""
+        self._placeholder.destroy()
+        
         setup_logging(self.log_queue)
         
         # 스타일 설정
@@ -126,6 +187,10 @@ class PhotoCardCropperApp:
         
         # 로그 업데이트 타이머
         self._poll_log_queue()
+        
+        # 크로퍼 모듈/얼굴 감지 모델 백그라운드 로딩
+        self._preload_thread = threading.Thread(target=self._preload_cropper, daemon=True)
+        self._preload_thread.start()
     
     def _setup_styles(self):
         """ttk 스타일 설정"""
@@ -274,7 +339,7 @@ class PhotoCardCropperApp:
         self.preset_combo = ttk.Combobox(
             preset_frame,
             textvariable=self.preset_var,
-            values=list(self.PRESET_SIZES.keys()),
+            values=[preset[0] for preset in self.PRESETS],
             state='readonly',
             width=20
         )
@@ -286,10 +351,15 @@ class PhotoCardCropperApp:
         size_input_frame.pack(fill='x', pady=(10, 0))
         
         ttk.Label(size_input_frame, text="가로:").pack(side='left')
+        # 숫자 이외 입력은 키 입력 단계에서 거부
+        numeric_vcmd = (self.root.register(self._is_numeric), '%P')
+        
         self.width_entry = ttk.Entry(
             size_input_frame,
             textvariable=self.width_var,
-            width=8
+            width=8,
+            validate='key',
+            validatecommand=numeric_vcmd
         )
         self.width_entry.pack(side='left', padx=(5, 0))
         ttk.Label(size_input_frame, text="mm").pack(side='left', padx=(2, 15))
@@ -298,7 +368,9 @@ class PhotoCardCropperApp:
         self.height_entry = ttk.Entry(
             size_input_frame,
             textvariable=self.height_var,
-            width=8
+            width=8,
+            validate='key',
+            validatecommand=numeric_vcmd
         )
         self.height_entry.pack(side='left', padx=(5, 0))
         ttk.Label(size_input_frame, text="mm").pack(side='left', padx=(2, 0))
@@ -311,9 +383,11 @@ class PhotoCardCropperApp:
         )
         self.ratio_label.pack(anchor='w', pady=(5, 0))
         
-        # 입력값 변경 시 비율 업데이트
-        self.width_var.trace_add('write', self._on_size_change)
-        self.height_var.trace_add('write', self._on_size_change)
+        # 입력 완료(포커스 이동/Enter) 또는 입력이 잠시 멈추면 비율 업데이트
+        for entry in (self.width_entry, self.height_entry):
+            entry.bind('<FocusOut>', self._commit_size)
+            entry.bind('<Return>', self._commit_size)
+            entry.bind('<KeyRelease>', self._schedule_size_commit)
         
         # 구분선
         ttk.Separator(section_frame, orient='horizontal').pack(fill='x', pady=15)
@@ -485,6 +559,11 @@ class PhotoCardCropperApp:
             text="← 위로 이동  │  아래로 이동 →",
             style='Hint.TLabel'
         ).pack(fill='x', pady=(3, 0))
+        
+        # 드래그 중에는 빠른 보간, 놓으면 고화질로 다시 렌더링
+        for slider in (self.zoom_slider, self.eye_slider, self.offset_x_slider, self.offset_y_slider):
+            slider.bind('<ButtonPress-1>', self._on_slider_press, add='+')
+            slider.bind('<ButtonRelease-1>', self._on_slider_release, add='+')
     
     def _create_action_section(self, parent):
         """실행 버튼 섹션"""
@@ -579,16 +658,39 @@ class PhotoCardCropperApp:
         self.preview_info_label.pack(pady=(0, 10))
         
         # 미리보기 캔버스 (고정 크기)
+        canvas_width, canvas_height = self.PREVIEW_CANVAS_SIZE
         self.preview_canvas = tk.Canvas(
             section_frame,
-            width=280,
-            height=430,
+            width=canvas_width,
+            height=canvas_height,
             bg='#2D2D2D',
             highlightthickness=1,
             highlightbackground='#555555'
         )
         self.preview_canvas.pack(pady=5)
         
+        # 캔버스 크기의 표시 버퍼 하나를 계속 재사용 (프레임마다 PhotoImage를 새로 만들지 않음)
+        # 렌더링 스레드가 numpy 버퍼에 직접 그리고, PIL 이미지는 같은 메모리를 복사 없이 참조
+        self._preview_np_buf = np.empty((canvas_height, canvas_width, 4), dtype=np.uint8)
+        self._preview_np_buf[:] = self.PREVIEW_CANVAS_BG
+        self._preview_backing = Image.frombuffer(
+            'RGBA', self.PREVIEW_CANVAS_SIZE, self._preview_np_buf, 'raw', 'RGBA', 0, 1
+        )
+        self._preview_tkimg = ImageTk.PhotoImage(self._preview_backing)
+        self._preview_image_item = self.preview_canvas.create_image(
+            canvas_width // 2, canvas_height // 2,
+            image=self._preview_tkimg,
+            anchor='center',
+            state='hidden'
+        )
+        self._preview_text_item = self.preview_canvas.create_text(
+            canvas_width // 2, canvas_height // 2,
+            text="얼굴을 감지하지 못했습니다",
+            fill='#FF6B6B',
+            font=('SF Pro Display', 11),
+            state='hidden'
+        )
+        
         # 이미지 선택 버튼
         btn_frame = ttk.Frame(section_frame)
         btn_frame.pack(fill='x', pady=(10, 0))
@@ -641,18 +743,17 @@ class PhotoCardCropperApp:
     def _on_preset_change(self, event):
         """프리셋 선택 변경"""
         preset_name = self.preset_var.get()
-        if preset_name in self.PRESET_SIZES:
-            width, height = self.PRESET_SIZES[preset_name]
+        preset = self.PRESET_BY_NAME.get(preset_name)
+        if preset is not None:
+            _, width, height, ratio_text = preset
             
-            # 플래그 설정: _on_size_change에서 프리셋 변경 방지
-            self._updating_from_preset = True
+            # 입력란 값 변경 (trace가 없으므로 콜백 없이 한 번에 반영)
             self.width_var.set(str(width))
             self.height_var.set(str(height))
-            self._updating_from_preset = False
+            self._committed_size = (float(width), float(height))
             
-            # 비율 라벨 업데이트
-            ratio = width / height
-            self.ratio_label.configure(text=f"비율: {width:.0f}:{height:.0f} ({ratio:.3f})")
+            # 비율 라벨 업데이트 (미리 계산된 문자열)
+            self._set_if_changed(self.ratio_label, ratio_text)
             
             if preset_name != '사용자 정의':
                 self._append_log(f"📐 규격 변경: {preset_name}")
@@ -660,25 +761,40 @@ class PhotoCardCropperApp:
             # 미리보기 업데이트
             self._schedule_preview_update()
     
-    def _on_size_change(self, *args):
-        """가로/세로 값 변경 시 비율 업데이트"""
-        # 프리셋에서 업데이트 중이면 무시
-        if getattr(self, '_updating_from_preset', False):
-            return
-            
+    @staticmethod
+    def _is_numeric(proposed: str) -> bool:
+        """입력란 검증: 빈 문자열 또는 숫자와 소수점 하나까지만 허용"""
+        return proposed.count('.') <= 1 and all(c in '0123456789.' for c in proposed)
+    
+    def _schedule_size_commit(self, event=None):
+        """입력이 200ms 멈추면 가로/세로 값 반영"""
+        if self._size_commit_job is not None:
+            self.root.after_cancel(self._size_commit_job)
+        self._size_commit_job = self.root.after(200, self._commit_size)
+    
+    def _commit_size(self, event=None):
+        """가로/세로 입력값 반영 (비율 업데이트 + 미리보기)"""
+        if self._size_commit_job is not None:
+            self.root.after_cancel(self._size_commit_job)
+            self._size_commit_job = None
+        
         try:
             width = float(self.width_var.get())
             height = float(self.height_var.get())
             
+            # 마지막으로 반영한 값과 같으면 무시
+            if (width, height) == self._committed_size:
+                return
+            
             if width > 0 and height > 0:
-                ratio = width / height
-                self.ratio_label.configure(text=f"비율: {width:.0f}:{height:.0f} ({ratio:.3f})")
+                self._committed_size = (width, height)
+                self._update_ratio_label(width, height)
                 
                 # 사용자가 직접 값을 변경한 경우 프리셋을 '사용자 정의'로 변경
                 current_preset = self.preset_var.get()
                 if current_preset != '사용자 정의':
-                    preset_size = self.PRESET_SIZES.get(current_preset)
-                    if preset_size and (preset_size[0] != width or preset_size[1] != height):
+                    preset = self.PRESET_BY_NAME.get(current_preset)
+                    if preset and (preset[1] != width or preset[2] != height):
                         self.preset_var.set('사용자 정의')
                 
                 # 미리보기 업데이트
@@ -686,26 +802,49 @@ class PhotoCardCropperApp:
         except ValueError:
             pass
     
+    @staticmethod
+    def _set_if_changed(widget, text: str):
+        """라벨 텍스트가 달라졌을 때만 configure (불필요한 레이아웃 갱신 방지)"""
+        if widget.cget('text') != text:
+            widget.configure(text=text)
+    
+    def _update_ratio_label(self, width: float, height: float):
+        """비율 라벨 업데이트"""
+        ratio = width / height
+        self._set_if_changed(self.ratio_label, f"비율: {width:.0f}:{height:.0f} ({ratio:.3f})")
+    
     def _on_zoom_change(self, value):
         """Zoom 슬라이더 변경"""
-        val = float(value)
-        self.zoom_value_label.configure(text=f"{val:.2f}")
+        val = round(float(value), 2)
+        if val == self._last_zoom:
+            return
+        self._last_zoom = val
+        
+        self._set_if_changed(self.zoom_value_label, f"{val:.2f}")
         # 미리보기 업데이트 (디바운싱)
         self._schedule_preview_update()
     
     def _on_eye_change(self, value):
         """Eye Position 슬라이더 변경"""
-        val = float(value)
-        self.eye_value_label.configure(text=f"{val:.2f}")
+        val = round(float(value), 2)
+        if val == self._last_eye:
+            return
+        self._last_eye = val
+        
+        self._set_if_changed(self.eye_value_label, f"{val:.2f}")
         # 미리보기 업데이트 (디바운싱)
         self._schedule_preview_update()
     
     def _on_offset_x_change(self, value):
         """좌우 오프셋 슬라이더 변경"""
-        val = float(value)
+        # 1% 단위로 반올림하여 같은 값이면 무시
+        percent = round(float(value) * 100)
+        if percent == self._last_ox:
+            return
+        self._last_ox = percent
+        
         # 퍼센트로 표시
-        percent = int(val * 100)
-        self.offset_x_value_label.configure(text=f"{percent:+d}%")
+        self._set_if_changed(self.offset_x_value_label, f"{percent:+d}%")
         # 현재 이미지에 오프셋 저장
         self._save_current_image_offset()
         # 미리보기 업데이트 (디바운싱)
@@ -713,68 +852,121 @@ class PhotoCardCropperApp:
     
     def _on_offset_y_change(self, value):
         """상하 오프셋 슬라이더 변경"""
-        val = float(value)
+        # 1% 단위로 반올림하여 같은 값이면 무시
+        percent = round(float(value) * 100)
+        if percent == self._last_oy:
+            return
+        self._last_oy = percent
+        
         # 퍼센트로 표시
-        percent = int(val * 100)
-        self.offset_y_value_label.configure(text=f"{percent:+d}%")
+        self._set_if_changed(self.offset_y_value_label, f"{percent:+d}%")
         # 현재 이미지에 오프셋 저장
         self._save_current_image_offset()
         # 미리보기 업데이트 (디바운싱)
         self._schedule_preview_update()
     
+    def _on_slider_press(self, event):
+        """슬라이더 드래그 시작"""
+        self._dragging = True
+    
+    def _on_slider_release(self, event):
+        """슬라이더 드래그 종료 (고화질 미리보기로 갱신)"""
+        self._dragging = False
+        self._cancel_preview_settle()
+        self._schedule_preview_update()
+    
+    def _cancel_preview_settle(self):
+        """드래그 멈춤 감지 예약 취소"""
+        self._drag_settled = False
+        if self._preview_settle_job is not None:
+            self.root.after_cancel(self._preview_settle_job)
+            self._preview_settle_job = None
+    
+    def _on_preview_settle(self):
+        """드래그 중 슬라이더가 멈춤 (놓기 전이라도 고화질로 갱신)"""
+        self._preview_settle_job = None
+        if self._dragging:
+            self._drag_settled = True
+            self._schedule_preview_update()
+    
     def _save_current_image_offset(self):
         """현재 이미지의 오프셋 값 저장"""
         if self.preview_images and 0 <= self.preview_index < len(self.preview_images):
             image_path = self.preview_images[self.preview_index]
-            offset_x = self.offset_x_var.get()
-            offset_y = self.offset_y_var.get()
-            self.image_offsets[image_path] = (offset_x, offset_y)
+            offset_x = round(self.offset_x_var.get(), 2)
+            offset_y = round(self.offset_y_var.get(), 2)
+            file_id = self._file_id(image_path)
+            
+            # 0 <-> 0이 아닌 값으로 바뀔 때만 조정된 이미지 수 증감
+            old_x, old_y = self.image_offsets.get(file_id, (0.0, 0.0))
+            was_adjusted = old_x != 0 or old_y != 0
+            is_adjusted = offset_x != 0 or offset_y != 0
+            self._nonzero_offset_count += is_adjusted - was_adjusted
+            
+            self.image_offsets[file_id] = (offset_x, offset_y)
             # 조정된 이미지 수 업데이트
             self._update_offset_count()
     
     def _load_image_offset(self, image_path: str):
         """이미지의 저장된 오프셋 값 불러오기"""
-        if image_path in self.image_offsets:
-            offset_x, offset_y = self.image_offsets[image_path]
-        else:
-            # 저장된 값이 없으면 기본값 (0, 0) 사용
-            offset_x, offset_y = 0.0, 0.0
+        # 저장된 값이 없으면 기본값 (0, 0) 사용
+        offset_x, offset_y = self.image_offsets.get(self._file_id(image_path), (0.0, 0.0))
         
-        # 슬라이더 업데이트 (이벤트 방지를 위해 trace 없이)
+        # 슬라이더 업데이트 (트레이스 없이 변수만 설정)
         self.offset_x_var.set(offset_x)
         self.offset_y_var.set(offset_y)
         
-        # 라벨 업데이트
-        self.offset_x_value_label.configure(text=f"{int(offset_x * 100):+d}%")
-        self.offset_y_value_label.configure(text=f"{int(offset_y * 100):+d}%")
+        # 라벨 업데이트 (슬라이더 콜백의 중복 판단 기준도 함께 맞춤)
+        self._last_ox = round(offset_x * 100)
+        self._last_oy = round(offset_y * 100)
+        self._set_if_changed(self.offset_x_value_label, f"{self._last_ox:+d}%")
+        self._set_if_changed(self.offset_y_value_label, f"{self._last_oy:+d}%")
     
     def _reset_current_image_offset(self):
         """현재 이미지의 오프셋 초기화"""
         self.offset_x_var.set(0.0)
         self.offset_y_var.set(0.0)
-        self.offset_x_value_label.configure(text="+0%")
-        self.offset_y_value_label.configure(text="+0%")
+        self._last_ox = 0
+        self._last_oy = 0
+        self._set_if_changed(self.offset_x_value_label, "+0%")
+        self._set_if_changed(self.offset_y_value_label, "+0%")
         self._save_current_image_offset()
         self._schedule_preview_update()
     
+    def _file_id(self, image_path: str) -> Tuple[int, int]:
+        """이미지 경로의 파일 ID (stat 결과 캐시)"""
+        file_id = self._stat_cache.get(image_path)
+        if file_id is None:
+            file_id = self._stat_file_id(image_path)
+            self._stat_cache[image_path] = file_id
+        return file_id
+    
+    @staticmethod
+    def _stat_file_id(image_path: str) -> Tuple[int, int]:
+        """
+        파일 ID (st_dev, st_ino) 조회
+        
+        Windows에서도 os.stat이 볼륨 번호/파일 인덱스를 채워줍니다.
+        stat 실패 시에는 정규화된 경로를 대신 사용합니다.
+        """
+        try:
+            st = os.stat(image_path)
+            return (st.st_dev, st.st_ino)
+        except OSError:
+            return (0, hash(os.path.normcase(os.path.abspath(image_path))))
+    
     def _update_offset_count(self):
         """조정된 이미지 수 업데이트"""
-        # 0이 아닌 오프셋을 가진 이미지 수 계산
-        adjusted_count = sum(
-            1 for ox, oy in self.image_offsets.values() 
-            if ox != 0 or oy != 0
-        )
-        self.offset_count_label.configure(text=f"조정된 이미지: {adjusted_count}개")
+        self._set_if_changed(self.offset_count_label, f"조정된 이미지: {self._nonzero_offset_count}개")
     
     def _clear_log(self):
         """로그 지우기"""
         self.log_text.delete('1.0', END)
     
     def _append_log(self, message: str):
-        """로그 추가"""
+        """로그 추가 (다음 폴링 때 다른 로그와 함께 한 번에 표시)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(END, f"[{timestamp}] {message}\n")
-        self.log_text.see(END)
+        self.log_queue.put(f"[{timestamp}] {message}")
     
     def _truncate_path(self, path: str, max_length: int) -> str:
         """긴 경로 줄이기"""
@@ -787,54 +979,64 @@ class PhotoCardCropperApp:
     # ============================================================
     
     def _load_preview_images(self, folder: str):
-        """폴더에서 미리보기용 이미지 목록 로드 (하위 폴더 포함)"""
-        supported_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'}
+        """폴더에서 미리보기용 이미지 목록 로드 (하위 폴더 포함, 백그라운드)"""
+        self._set_if_changed(self.preview_info_label, "스캐닝 중...")
+        self.preview_draft_image = None
+        self._clear_preview_canvas()
         
-        # 성능 제한: 최대 탐색 깊이 및 최대 이미지 수
-        MAX_DEPTH = 5
-        MAX_IMAGES = 1000
+        # 폴더 탐색과 첫 이미지 디코딩은 UI를 막지 않도록 별도 스레드에서 수행
+        threading.Thread(target=self._scan_and_decode, args=(folder,), daemon=True).start()
+    
+    def _scan_and_decode(self, folder: str):
+        """이미지 목록 스캔 + 첫 이미지 디코딩 (작업 스레드, tkinter 접근 금지)"""
+        try:
+            # 스캔 시작 (경로 기준으로 정렬되어 반환)
+            images = self._scan_image_files(folder, self.PREVIEW_MAX_DEPTH, self.PREVIEW_MAX_IMAGES)
+            first_entry = None
+            if images:
+                # 수정 시각은 디코딩 전에 확인 (디코딩 중 파일이 바뀌면 다음 조회 때 다시 디코딩)
+                mtime = self._mtime_ns(images[0])
+                first_decoded = self._decode_draft(images[0])
+                if first_decoded is not None:
+                    first_entry = (mtime, first_decoded)
+        except Exception as e:
+            self.root.after(0, self._on_scan_failed, folder, e)
+            return
         
-        images = []
+        self.root.after(0, self._on_scan_done, folder, images, first_entry)
+    
+    def _on_scan_failed(self, folder: str, error: Exception):
+        """스캔 실패 처리 (메인 스레드, '스캐닝 중...' 표시 해제)"""
+        if folder != self.input_dir:
+            return
         
-        def scan_folder(current_folder: str, current_depth: int):
-            """재귀적으로 폴더 스캔 (깊이 제한 적용)"""
-            if current_depth > MAX_DEPTH or len(images) >= MAX_IMAGES:
-                return
-            
-            try:
-                entries = sorted(os.listdir(current_folder))
-            except PermissionError:
-                return  # 권한 없는 폴더 스킵
-            
-            for entry in entries:
-                if len(images) >= MAX_IMAGES:
-                    break
-                
-                full_path = os.path.join(current_folder, entry)
-                
-                # 심볼릭 링크 무시 (무한 루프 방지)
-                if os.path.islink(full_path):
-                    continue
-                
-                if os.path.isfile(full_path):
-                    ext = os.path.splitext(entry)[1].lower()
-                    if ext in supported_extensions:
-                        images.append(full_path)
-                elif os.path.isdir(full_path):
-                    # 숨김 폴더 스킵 (예: .git, .DS_Store 등)
-                    if not entry.startswith('.'):
-                        scan_folder(full_path, current_depth + 1)
-        
-        # 스캔 시작
-        scan_folder(folder, 0)
-        
-        # 경로 기준으로 정렬
-        images.sort()
+        self.preview_images = []
+        self.preview_index = 0
+        self._append_log(f"⚠️ 폴더 스캔 실패: {error}")
+        self._set_if_changed(self.preview_info_label, "폴더를 읽을 수 없습니다")
+        self._clear_preview_canvas()
+    
+    def _on_scan_done(
+        self,
+        folder: str,
+        images: List[str],
+        first_entry: Optional[Tuple[Optional[int], Tuple[np.ndarray, Tuple[int, int]]]]
+    ):
+        """스캔 결과 반영 (메인 스레드)"""
+        # 스캔 중 다른 폴더를 선택했으면 이전 결과는 버림
+        if folder != self.input_dir:
+            return
         
+        self._decode_cache.clear()
+        self._detection_cache.clear()
+        self._stat_cache.clear()
         self.preview_images = images
         self.preview_index = 0
         
         if images:
+            if first_entry is not None:
+                self._decode_cache[images[0]] = (*first_entry, self._new_draft_serial())
+            
             # 하위 폴더 수 계산
             unique_folders = set(os.path.dirname(img) for img in images)
             folder_count = len(unique_folders)
@@ -844,14 +1046,74 @@ class PhotoCardCropperApp:
             else:
                 self._append_log(f"📷 미리보기: {len(images)}개 이미지 발견")
             
-            if len(images) >= MAX_IMAGES:
-                self._append_log(f"⚠️ 최대 {MAX_IMAGES}개까지만 표시됩니다")
+            if len(images) >= self.PREVIEW_MAX_IMAGES:
+                self._append_log(f"⚠️ 최대 {self.PREVIEW_MAX_IMAGES}개까지만 표시됩니다")
             
             self._load_current_preview_image()
         else:
             self._append_log("⚠️ 폴더에 이미지 파일이 없습니다")
-            self.preview_info_label.configure(text="이미지 파일이 없습니다")
-            self.preview_canvas.delete("all")
+            self._set_if_changed(self.preview_info_label, "이미지 파일이 없습니다")
+            self._clear_preview_canvas()
+    
+    @staticmethod
+    def _scan_image_files(folder: str, max_depth: int, max_images: int) -> List[str]:
+        """
+        하위 폴더까지 이미지 파일 경로 수집 (깊이/개수 제한)
+        
+        폴더 단위로 스레드 풀에 나눠 읽으므로 네트워크 드라이브나 콜드 캐시에서
+        디렉토리 읽기 지연이 겹쳐 처리됩니다. 개수 제한은 전체 경로 정렬 순서의
+        앞쪽 max_images개로 적용되어 폴더 읽기 완료 순서와 관계없이 항상 같은 파일이 선택됩니다.
+        """
+        supported_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'}
+        
+        def scan_dir(current_folder: str) -> Tuple[List[str], List[str]]:
+            """한 폴더의 이미지 파일과 하위 폴더 목록 반환"""
+            files = []
+            subdirs = []
+            try:
+                # scandir은 디렉토리 읽기 시 파일 종류를 함께 받아오므로 항목별 stat 불필요
+                with os.scandir(current_folder) as it:
+                    for entry in it:
+                        # 심볼릭 링크 무시 (무한 루프 방지)
+                        if entry.is_symlink():
+                            continue
+                        
+                        if entry.is_file(follow_symlinks=False):
+                            ext = os.path.splitext(entry.name)[1].lower()
+                            if ext in supported_extensions:
+                                files.append(entry.path)
+                        elif entry.is_dir(follow_symlinks=False):
+                            # 숨김 폴더 스킵 (예: .git, .DS_Store 등)
+                            if not entry.name.startswith('.'):
+                                subdirs.append(entry.path)
+            except PermissionError:
+                pass  # 권한 없는 폴더 스킵
+            return files, subdirs
+        
+        images = []
+        frontier = [folder]
+        depth = 0
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # 깊이 단위(BFS)로 한 단계를 모두 읽은 뒤에만 개수 제한 판단
+            while frontier:
+                next_frontier = []
+                for files, subdirs in executor.map(scan_dir, frontier):
+                    images.extend(files)
+                    next_frontier.extend(subdirs)
+                
+                if len(images) >= max_images:
+                    # 정렬 기준 앞쪽 max_images개만 유지하고, 하위 경로가 모두 마지막 파일보다
+                    # 뒤로 정렬되는 폴더(폴더 경로 + 구분자 > 마지막 파일)는 더 읽지 않음
+                    images.sort()
+                    del images[max_images:]
+                    cutoff = images[-1]
+                    next_frontier = [subdir for subdir in next_frontier if subdir + os.sep < cutoff]
+                
+                depth += 1
+                frontier = next_frontier if depth <= max_depth else []
+        
+        images.sort()
+        return images
     
     def _load_current_preview_image(self):
         """현재 인덱스의 이미지를 로드"""
@@ -872,13 +1134,14 @@ class PhotoCardCropperApp:
             rel_folder = ""
         
         try:
-            # 이미지 로드 (OpenCV)
-            self.preview_original_image = cv2.imread(image_path)
-            if self.preview_original_image is None:
+            # 이미지 로드 (OpenCV, 최근 이미지는 캐시 사용)
+            cached = self._decode_cached(image_path)
+            if cached is None:
                 raise ValueError("이미지를 읽을 수 없습니다")
             
+            (self.preview_draft_image, (w, h)), self._preview_draft_serial = cached
+            
             # 정보 표시 (폴더 경로 포함 + 개별 오프셋 상태)
-            h, w = self.preview_original_image.shape[:2]
             if rel_folder:
                 display_name = f"📁 {rel_folder}/\n📄 {filename}"
             else:
@@ -886,21 +1149,197 @@ class PhotoCardCropperApp:
             
             # 개별 오프셋 설정 여부 표시
             offset_indicator = ""
-            if image_path in self.image_offsets:
-                ox, oy = self.image_offsets[image_path]
-                if ox != 0 or oy != 0:
-                    offset_indicator = " 📍"
+            ox, oy = self.image_offsets.get(self._file_id(image_path), (0.0, 0.0))
+            if ox != 0 or oy != 0:
+                offset_indicator = " 📍"
             
-            self.preview_info_label.configure(
-                text=f"{display_name}\n({w}×{h}px) - {self.preview_index + 1}/{len(self.preview_images)}{offset_indicator}"
+            self._set_if_changed(
+                self.preview_info_label,
+                f"{display_name}\n({w}×{h}px) - {self.preview_index + 1}/{len(self.preview_images)}{offset_indicator}"
             )
             
             # 미리보기 업데이트
-            self._update_preview()
+            self._schedule_preview_update()
             
         except Exception as e:
             self._append_log(f"⚠️ 미리보기 로드 실패: {filename} - {e}")
-            self.preview_info_label.configure(text=f"로드 실패: {filename}")
+            self._set_if_changed(self.preview_info_label, f"로드 실패: {filename}")
+    
+    def _new_draft_serial(self) -> int:
+        """새로 디코딩한 축소본에 붙일 번호"""
+        self._draft_serial_counter += 1
+        return self._draft_serial_counter
+    
+    def _decode_cached(
+        self,
+        image_path: str
+    ) -> Optional[Tuple[Tuple[np.ndarray, Tuple[int, int]], int]]:
+        """
+        미리보기용 축소본 디코딩 (LRU 캐시)
+        
+        슬라이더 조작마다 반복되는 크롭 연산이 원본 대신 축소본에서 수행되도록
+        긴 변을 PREVIEW_DRAFT_MAX_SIDE로 한 번만 줄여 둡니다.
+        파일 수정 시각이 바뀌면 캐시(얼굴 감지 결과 포함)를 버리고 다시 디코딩합니다.
+        
+        Returns:
+            ((축소본 BGR 배열, (원본 가로, 원본 세로)), 디코딩 번호) 또는 실패 시 None
+        """
+        mtime = self._mtime_ns(image_path)
+        cached = self._decode_cache.get(image_path)
+        if cached is not None:
+            if cached[0] == mtime:
+                self._decode_cache.move_to_end(image_path)
+                return cached[1], cached[2]
+            
+            # 파일이 바뀜
+            del self._decode_cache[image_path]
+            self._detection_cache.pop(image_path, None)
+        
+        decoded = self._decode_draft(image_path)
+        if decoded is None:
+            return None
+        
+        serial = self._new_draft_serial()
+        self._decode_cache[image_path] = (mtime, decoded, serial)
+        if len(self._decode_cache) > self.PREVIEW_CACHE_SIZE:
+            # 축소본과 함께 얼굴 감지 결과도 정리
+            evicted_path, _ = self._decode_cache.popitem(last=False)
+            self._detection_cache.pop(evicted_path, None)
+        return decoded, serial
+    
+    @staticmethod
+    def _mtime_ns(image_path: str) -> Optional[int]:
+        """파일 수정 시각 (ns), 조회 실패 시 None"""
+        try:
+            return os.stat(image_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    @classmethod
+    def _decode_draft(cls, image_path: str) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+        """이미지를 디코딩하여 미리보기용 축소본과 원본 크기 반환 (메모리 캐시 미사용, 스레드 안전)"""
+        # 이전 실행에서 만든 디스크 썸네일이 있으면 원본 디코딩 생략
+        thumb_path = cls._thumb_path(image_path)
+        if thumb_path is not None:
+            cached = cls._load_thumb(image_path, thumb_path)
+            if cached is not None:
+                return cached
+        
+        image = None
+        original_size = None
+        if os.path.splitext(image_path)[1].lower() in ('.jpg', '.jpeg'):
+            image, original_size = cls._decode_jpeg_reduced(image_path)
+        
+        if image is None:
+            from utils.file_handler import FileHandler
+            image = FileHandler.load_image(image_path)
+            if image is None:
+                return None
+            original_size = (image.shape[1], image.shape[0])
+        
+        h, w = image.shape[:2]
+        scale = cls.PREVIEW_DRAFT_MAX_SIDE / max(h, w)
+        if scale < 1:
+            image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
+        if thumb_path is not None and max(original_size) > cls.PREVIEW_DRAFT_MAX_SIDE:
+            cls._save_thumb(thumb_path, image)
+        
+        return image, original_size
+    
+    @classmethod
+    def _decode_jpeg_reduced(
+        cls,
+        image_path: str
+    ) -> Tuple[Optional[np.ndarray], Optional[Tuple[int, int]]]:
+        """
+        JPEG를 DCT 단계에서 1/2 ~ 1/8로 축소 디코딩
+        
+        미리보기 크기 이상을 유지하는 가장 큰 배율을 사용합니다.
+        
+        Returns:
+            (축소 디코딩 이미지, (원본 가로, 원본 세로)), 축소 불필요/실패 시 (None, None)
+        """
+        from utils.file_handler import FileHandler
+        
+        # 원본 크기는 헤더만 읽어 확인
+        info = FileHandler.get_image_info_fast(image_path)
+        if info is None:
+            return None, None
+        size = (info['width'], info['height'])
+        
+        for factor in (8, 4, 2):
+            if max(size) // factor >= cls.PREVIEW_DRAFT_MAX_SIDE:
+                image = FileHandler.load_image_preview(image_path, factor)
+                if image is None:
+                    return None, None
+                return image, cls._oriented_size(size, image)
+        
+        return None, None
+    
+    @staticmethod
+    def _oriented_size(size: Tuple[int, int], image: np.ndarray) -> Tuple[int, int]:
+        """헤더 기준 원본 크기를 디코딩 결과 방향에 맞춤 (EXIF 회전으로 가로/세로가 바뀐 경우)"""
+        w, h = size
+        if (w > h) != (image.shape[1] > image.shape[0]):
+            return h, w
+        return w, h
+    
+    @classmethod
+    def _thumb_path(cls, image_path: str) -> Optional[Path]:
+        """(경로, 수정 시각, 파일 크기) 해시로 디스크 썸네일 경로 생성"""
+        try:
+            st = os.stat(image_path)
+        except OSError:
+            return None
+        
+        key = f"{os.path.abspath(image_path)}|{st.st_mtime_ns}|{st.st_size}"
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+        return cls.THUMB_CACHE_DIR / f"{digest}.jpg"
+    
+    @staticmethod
+    def _load_thumb(image_path: str, thumb_path: Path) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+        """디스크 썸네일 로드 (없거나 읽기 실패 시 None)"""
+        if not thumb_path.exists():
+            return None
+        
+        try:
+            # 한글 경로 대응을 위해 imdecode 사용
+            thumb = cv2.imdecode(np.fromfile(str(thumb_path), dtype=np.uint8), cv2.IMREAD_COLOR)
+            if thumb is None:
+                return None
+            
+            # 원본 크기는 헤더만 읽어 확인
+            from utils.file_handler import FileHandler
+            info = FileHandler.get_image_info_fast(image_path)
+            if info is None:
+                return None
+            size = (info['width'], info['height'])
+            
+            # 최근 사용 순 정리를 위해 수정 시각 갱신
+            os.utime(thumb_path)
+            return thumb, PhotoCardCropperApp._oriented_size(size, thumb)
+        except (OSError, cv2.error):
+            return None
+    
+    @classmethod
+    def _save_thumb(cls, thumb_path: Path, image: np.ndarray):
+        """디스크 썸네일 저장 후 최대 개수를 넘으면 오래된 것부터 삭제"""
+        try:
+            thumb_path.parent.mkdir(parents=True, exist_ok=True)
+            ok, encoded = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            if not ok:
+                return
+            encoded.tofile(str(thumb_path))
+            
+            with os.scandir(thumb_path.parent) as it:
+                entries = list(it)
+            if len(entries) > cls.THUMB_CACHE_MAX_FILES:
+                entries.sort(key=lambda e: e.stat().st_mtime)
+                for entry in entries[:len(entries) - cls.THUMB_CACHE_MAX_FILES]:
+                    os.remove(entry.path)
+        except (OSError, cv2.error):
+            pass  # 캐시 저장 실패는 미리보기에 영향 없음
     
     def _prev_preview_image(self):
         """이전 이미지"""
@@ -915,27 +1354,39 @@ class PhotoCardCropperApp:
             self._load_current_preview_image()
     
     def _schedule_preview_update(self):
-        """미리보기 업데이트 스케줄 (디바운싱)"""
-        # 기존 예약된 작업 취소
-        if self.preview_update_job is not None:
-            self.root.after_cancel(self.preview_update_job)
-        
-        # 150ms 후에 업데이트 (슬라이더 드래그 중 과도한 호출 방지)
-        self.preview_update_job = self.root.after(150, self._update_preview)
+        """
+        미리보기 업데이트 예약
+        
+        UI가 유휴 상태가 되면 바로 렌더링하고, 렌더링 중에 들어온 요청은
+        완료 후 최신 값으로 한 번만 다시 실행합니다.
+        """
+        # 드래그 중 값이 바뀔 때마다 멈춤 감지 타이머를 다시 시작
+        if self._dragging:
+            self._cancel_preview_settle()
+            self._preview_settle_job = self.root.after(self.PREVIEW_SETTLE_MS, self._on_preview_settle)
+        
+        self._preview_dirty = True
+        if not self._preview_inflight:
+            self._preview_inflight = True
+            self.root.after_idle(self._update_preview)
     
     def _update_preview(self):
-        """미리보기 이미지 업데이트"""
-        self.preview_update_job = None
+        """현재 설정 값을 스냅샷하여 백그라운드 미리보기 렌더링 시작"""
+        self._preview_dirty = False
+        
+        if self.preview_draft_image is None:
+            self._preview_inflight = False
+            return
         
-        if self.preview_original_image is None:
+        # 크로퍼 로딩 전이면 잠시 후 다시 시도 (최신 설정으로 렌더링)
+        if self.preview_cropper is None:
+            if self._preload_thread.is_alive():
+                self.root.after(50, self._update_preview)
+            else:
+                self._preview_inflight = False
             return
         
         try:
-            # 크로퍼 초기화 (필요시)
-            if self.preview_cropper is None:
-                from core.cropper import PhotoCardCropper
-                self.preview_cropper = PhotoCardCropper(preserve_resolution=False)
-            
             # 현재 설정 값 가져오기
             zoom = self.zoom_var.get()
             eye_pos = self.eye_var.get()
@@ -947,102 +1398,187 @@ class PhotoCardCropperApp:
             except ValueError:
                 aspect_ratio = 55 / 85  # 기본 포토카드 비율
             
-            # 미리보기용 출력 크기 설정 (캔버스에 맞춤)
-            preview_height = 400
-            preview_width = int(preview_height * aspect_ratio)
+            # 미리보기용 출력 크기 설정 (비율 유지하며 캔버스에 맞춤, 크롭 결과를 그대로 표시)
+            canvas_width, canvas_height = self.PREVIEW_CANVAS_SIZE
+            if aspect_ratio > canvas_width / canvas_height:
+                preview_width = canvas_width - 10
+                preview_height = int(preview_width / aspect_ratio)
+            else:
+                preview_height = canvas_height - 10
+                preview_width = int(preview_height * aspect_ratio)
             
-            # 크로퍼 설정 업데이트
+            # 크로퍼 설정 업데이트 (렌더링은 한 번에 하나만 진행되므로 안전)
             self.preview_cropper.default_output_width = preview_width
             self.preview_cropper.default_output_height = preview_height
             self.preview_cropper.aspect_ratio = aspect_ratio
             
-            # 오프셋 값 가져오기
-            offset_x = self.offset_x_var.get()
-            offset_y = self.offset_y_var.get()
+            # 오프셋 값 가져오기 (저장 값과 같은 1% 단위)
+            offset_x = round(self.offset_x_var.get(), 2)
+            offset_y = round(self.offset_y_var.get(), 2)
+            
+            # 드래그 중에는 쌍선형으로 빠르게, 멈추거나 놓으면 축소/확대에 맞춰 자동 선택 (AREA/CUBIC/LANCZOS4)
+            interpolation = cv2.INTER_LINEAR if self._dragging and not self._drag_settled else None
+            
+            # 출력 픽셀이 달라지지 않는 미세한 변경이면 다시 렌더링하지 않음
+            key = (
+                round(zoom, 3), round(eye_pos, 3), offset_x, offset_y,
+                aspect_ratio, preview_width, preview_height, interpolation,
+                self._preview_generation, self.preview_images[self.preview_index],
+                self._preview_draft_serial
+            )
+            if key == self._last_preview_key:
+                self._preview_inflight = False
+                return
+            self._last_preview_key = key
+            
+        except Exception as e:
+            self._preview_inflight = False
+            self._append_log(f"⚠️ 미리보기 오류: {e}")
+            return
+        
+        threading.Thread(
+            target=self._render_preview,
+            args=(
+                self._preview_generation,
+                self.preview_images[self.preview_index],
+                self.preview_draft_image, self._preview_draft_serial,
+                zoom, eye_pos, offset_x, offset_y, interpolation
+            ),
+            daemon=True
+        ).start()
+    
+    def _render_preview(
+        self,
+        generation: int,
+        image_path: str,
+        image: np.ndarray,
+        draft_serial: int,
+        zoom: float,
+        eye_pos: float,
+        offset_x: float,
+        offset_y: float,
+        interpolation: Optional[int]
+    ):
+        """미리보기 크롭 및 리사이징 (작업 스레드, tkinter 접근 금지)"""
+        try:
+            # 얼굴 감지는 축소본당 한 번만 (슬라이더 값과 무관)
+            # 축소본 디코딩 번호를 함께 저장하여 다시 디코딩된 축소본에는 이전 결과를 쓰지 않음
+            cached = self._detection_cache.get(image_path)
+            if cached is not None and cached[0] == draft_serial:
+                face_box = cached[1]
+            else:
+                face_box = self.preview_cropper.detect_face(image)
+                self._detection_cache[image_path] = (draft_serial, face_box)
             
-            # 크롭 실행
-            result = self.preview_cropper.process_image_from_array(
-                self.preview_original_image,
+            # 크롭 실행 (기하 연산 + 표시 크기로 한 번만 리사이즈)
+            cropped_image = self.preview_cropper.crop_with_box(
+                image, face_box,
                 zoom_factor=zoom,
                 eye_position=eye_pos,
                 offset_x=offset_x,
-                offset_y=offset_y
+                offset_y=offset_y,
+                interpolation=interpolation
             )
             
-            if result is not None:
-                cropped_image = result[0]  # (image, dpi, exif, icc) 중 image만
-                
-                # BGR -> RGB 변환
-                cropped_rgb = cv2.cvtColor(cropped_image, cv2.COLOR_BGR2RGB)
-                
-                # PIL Image로 변환
-                pil_image = Image.fromarray(cropped_rgb)
-                
-                # 캔버스 크기에 맞게 리사이징
-                canvas_width = self.preview_canvas.winfo_width()
-                canvas_height = self.preview_canvas.winfo_height()
-                
-                if canvas_width < 10:  # 초기화 전이면 기본값 사용
-                    canvas_width = 280
-                    canvas_height = 430
-                
-                # 비율 유지하며 캔버스에 맞춤
-                img_ratio = pil_image.width / pil_image.height
-                canvas_ratio = canvas_width / canvas_height
-                
-                if img_ratio > canvas_ratio:
-                    new_width = canvas_width - 10
-                    new_height = int(new_width / img_ratio)
-                else:
-                    new_height = canvas_height - 10
-                    new_width = int(new_height * img_ratio)
-                
-                pil_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # PhotoImage로 변환 (참조 유지 필수)
-                self.preview_photo_image = ImageTk.PhotoImage(pil_image)
-                
-                # 캔버스에 표시
-                self.preview_canvas.delete("all")
-                x = canvas_width // 2
-                y = canvas_height // 2
-                self.preview_canvas.create_image(x, y, image=self.preview_photo_image, anchor='center')
-            else:
-                # 얼굴 감지 실패
-                self.preview_canvas.delete("all")
-                self.preview_canvas.create_text(
-                    140, 215,
-                    text="얼굴을 감지하지 못했습니다",
-                    fill='#FF6B6B',
-                    font=('SF Pro Display', 11)
-                )
-                
+            rendered = False
+            if cropped_image is not None:
+                # 표시 버퍼를 배경색으로 지우고 가운데 영역에 BGR -> RGBA 변환 결과를 바로 기록
+                # (렌더링은 한 번에 하나만 진행되고 결과 표시 후에 다음 렌더링이 시작되므로 안전)
+                buf = self._preview_np_buf
+                buf[:] = self.PREVIEW_CANVAS_BG
+                img_h, img_w = cropped_image.shape[:2]
+                y0 = (buf.shape[0] - img_h) // 2
+                x0 = (buf.shape[1] - img_w) // 2
+                cv2.cvtColor(cropped_image, cv2.COLOR_BGR2RGBA, dst=buf[y0:y0 + img_h, x0:x0 + img_w])
+                rendered = True
+            
+            self.root.after(0, self._on_preview_rendered, generation, rendered, None)
+            
         except Exception as e:
-            self._append_log(f"⚠️ 미리보기 오류: {e}")
+            self.root.after(0, self._on_preview_rendered, generation, False, e)
+    
+    def _on_preview_rendered(
+        self,
+        generation: int,
+        rendered: bool,
+        error: Optional[Exception]
+    ):
+        """렌더링 완료 처리 (메인 스레드)"""
+        # 렌더링 중 캔버스가 비워졌으면 (폴더 변경 등) 이전 결과는 표시하지 않음
+        if generation == self._preview_generation:
+            self._show_preview_result(rendered, error)
+        
+        # 실패한 설정은 같은 값으로도 다시 시도할 수 있게 함
+        if not rendered:
+            self._last_preview_key = None
+        
+        # 렌더링 중 설정이 바뀌었으면 최신 값으로 한 번 더 렌더링
+        if self._preview_dirty:
+            self.root.after_idle(self._update_preview)
+        else:
+            self._preview_inflight = False
+    
+    def _show_preview_result(self, rendered: bool, error: Optional[Exception]):
+        """렌더링 결과를 캔버스에 표시"""
+        if error is not None:
+            self._append_log(f"⚠️ 미리보기 오류: {error}")
+        elif rendered:
+            # 표시 버퍼 내용을 PhotoImage에 제자리 복사
+            self._preview_tkimg.paste(self._preview_backing)
+            
+            self.preview_canvas.itemconfigure(self._preview_text_item, state='hidden')
+            self.preview_canvas.itemconfigure(self._preview_image_item, state='normal')
+        else:
+            # 얼굴 감지 실패
+            self.preview_canvas.itemconfigure(self._preview_image_item, state='hidden')
+            self.preview_canvas.itemconfigure(self._preview_text_item, state='normal')
+    
+    def _clear_preview_canvas(self):
+        """미리보기 캔버스 비우기 (캔버스 항목은 숨기기만 하고 재사용)"""
+        self._preview_generation += 1
+        self.preview_canvas.itemconfigure(self._preview_image_item, state='hidden')
+        self.preview_canvas.itemconfigure(self._preview_text_item, state='hidden')
     
     def _poll_log_queue(self):
-        """로그 큐 폴링"""
+        """로그 큐 폴링 (진행 상황도 폴링마다 최신 값으로 한 번만 갱신)"""
+        try:
+            self._drain_log_queue()
+            
+            progress = self._pending_progress
+            if progress is not None and progress != self._shown_progress:
+                self._shown_progress = progress
+                self._update_progress(*progress)
+        finally:
+            self.root.after(100, self._poll_log_queue)
+    
+    def _drain_log_queue(self):
+        """큐에 쌓인 로그를 한 번의 insert로 표시하고 오래된 줄 정리"""
+        lines = []
         try:
             while True:
-                message = self.log_queue.get_nowait()
-                self.log_text.insert(END, message + "\n")
-                self.log_text.see(END)
+                lines.append(self.log_queue.get_nowait())
         except queue.Empty:
             pass
-        finally:
-            self.root.after(100, self._poll_log_queue)
+        
+        if not lines:
+            return
+        
+        lines.append('')
+        self.log_text.insert(END, "\n".join(lines))
+        
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > self.LOG_MAX_LINES:
+            self.log_text.delete('1.0', f'end-{self.LOG_MAX_LINES + 1} lines')
+        
+        self.log_text.see(END)
     
     # ============================================================
     # 이미지 처리
     # ============================================================
     
-    def _load_modules(self):
-        """모듈 지연 로딩"""
-        if self.cropper is None:
-            self._append_log("🔄 AI 모델 로딩 중... (최초 1회)")
-            self.root.update()
-            
-            # 지연 임포트
+    def _preload_cropper(self):
+        """크로퍼 모듈 임포트 및 얼굴 감지 모델 로딩 (별도 스레드)"""
+        try:
             from core.cropper import PhotoCardCropper
             from utils.file_handler import FileHandler, BatchProcessor
             
@@ -1050,6 +1586,22 @@ class PhotoCardCropperApp:
             self.FileHandler = FileHandler
             self.BatchProcessor = BatchProcessor
             
+            # 얼굴 감지 모델은 모든 크로퍼가 공유하므로 여기서 한 번만 로드됨
+            self.preview_cropper = PhotoCardCropper(preserve_resolution=False)
+        except Exception as e:
+            self.root.after(0, self._append_log, f"❌ 모델 로딩 실패: {e}")
+    
+    def _load_modules(self):
+        """백그라운드 모듈 로딩 완료 대기"""
+        if self.PhotoCardCropper is None:
+            self._append_log("🔄 AI 모델 로딩 중... (최초 1회)")
+            self._drain_log_queue()
+            self.root.update()
+            
+            self._preload_thread.join()
+            if self.PhotoCardCropper is None:
+                raise RuntimeError("모델 로딩 실패")
+            
             self._append_log("✅ 모델 로딩 완료")
     
     def _start_processing(self):
@@ -1082,13 +1634,19 @@ class PhotoCardCropperApp:
             return
         
         # 모듈 로딩 (스레드 시작 전에 동기적으로 실행)
-        self._load_modules()
+        try:
+            self._load_modules()
+        except RuntimeError as e:
+            self._append_log(f"❌ 오류: {e}")
+            return
         
         # 처리 시작
         self.is_processing = True
         self._set_ui_state(enabled=False)
         
         # 진행 상황 초기화
+        self._pending_progress = None
+        self._shown_progress = None
         self.progress_var.set(0)
         self.progress_label.configure(text="0 / 0 (0%)")
         self.status_label.configure(text="처리 중...")
@@ -1096,12 +1654,12 @@ class PhotoCardCropperApp:
         # 파라미터
         zoom_factor = self.zoom_var.get()
         eye_position = self.eye_var.get()
-        offset_x = self.offset_x_var.get()
-        offset_y = self.offset_y_var.get()
+        offset_x = round(self.offset_x_var.get(), 2)
+        offset_y = round(self.offset_y_var.get(), 2)
         
         offset_info = ""
         if offset_x != 0 or offset_y != 0:
-            offset_info = f", 오프셋: ({int(offset_x*100):+d}%, {int(offset_y*100):+d}%)"
+            offset_info = f", 오프셋: ({round(offset_x*100):+d}%, {round(offset_y*100):+d}%)"
         
         self._append_log(f"🚀 변환 시작 - 규격: {width_mm}×{height_mm}mm, zoom: {zoom_factor:.2f}, eye: {eye_position:.2f}{offset_info}")
         
@@ -1121,8 +1679,10 @@ class PhotoCardCropperApp:
         if image_offsets is None:
             image_offsets = {}
         
+        from core.cropper import configure_threading
+        
         try:
-            # 크로퍼 초기화 (사용자 정의 규격 + 원본 해상도/DPI 유지)
+            # 크로퍼 초기화 (사용자 정의 규격 + 원본 해상도/DPI 유지, 얼굴 감지 모델은 미리보기와 공유)
             cropper = self.PhotoCardCropper(
                 zoom_factor=zoom_factor,
                 eye_position=eye_position,
@@ -1150,30 +1710,48 @@ class PhotoCardCropperApp:
             total = len(images)
             
             if total == 0:
-                self.root.after(0, lambda: self._append_log("⚠️ 처리할 이미지가 없습니다."))
+                self._append_log("⚠️ 처리할 이미지가 없습니다.")
                 self.root.after(0, self._processing_complete)
                 return
             
-            # 개별 오프셋이 설정된 이미지 수
-            adjusted_count = sum(1 for img in images if str(img) in image_offsets and image_offsets[str(img)] != (0.0, 0.0))
+            # 이미지별 오프셋을 목록 순서대로 미리 결정 (stat은 이미지당 한 번, 작업 스레드에서는 조회 없음)
+            default_offset = (offset_x, offset_y)
+            adjusted_count = 0
+            if image_offsets:
+                resolved_offsets = []
+                for img in images:
+                    file_offset = image_offsets.get(self._stat_file_id(str(img)))
+                    if file_offset is None:
+                        resolved_offsets.append(default_offset)
+                    else:
+                        resolved_offsets.append(file_offset)
+                        # 개별 오프셋이 설정된 이미지 수
+                        if file_offset != (0.0, 0.0):
+                            adjusted_count += 1
+            else:
+                resolved_offsets = [default_offset] * total
             
-            self.root.after(0, lambda: self._append_log(f"📷 총 {total}개 이미지 발견"))
-            self.root.after(0, lambda w=width_mm, h=height_mm: self._append_log(f"📐 출력 규격: {w}×{h}mm (원본 DPI 유지)"))
+            # 로그는 큐에 쌓이고 _poll_log_queue가 한 번에 표시 (작업 스레드에서 호출 가능)
+            self._append_log(f"📷 총 {total}개 이미지 발견")
+            self._append_log(f"📐 출력 규격: {width_mm}×{height_mm}mm (원본 DPI 유지)")
             if adjusted_count > 0:
-                self.root.after(0, lambda c=adjusted_count: self._append_log(f"📍 개별 위치 조정: {c}개 이미지"))
+                self._append_log(f"📍 개별 위치 조정: {adjusted_count}개 이미지")
             
-            # 처리 루프
-            success_count = 0
-            fail_count = 0
+            # 출력 경로가 같은 입력(a.jpg, a.png 등)은 한 작업으로 묶어 순서대로 처리 (같은 파일 동시 쓰기 방지)
+            offset_of = dict(zip(images, resolved_offsets))
+            groups = [
+                [(image_path, offset_of[image_path]) for image_path in group]
+                for group in file_handler.group_by_output_path(images)
+            ]
+            for group in groups:
+                if len(group) > 1:
+                    names = ', '.join(image_path.name for image_path, _ in group)
+                    self._append_log(f"⚠️ 출력 파일 이름 충돌: {names} (마지막 이미지 결과만 남음)")
             
-            for idx, image_path in enumerate(images, 1):
+            def process_one(image_path: Path, img_offset: Tuple[float, float]) -> Tuple[bool, str]:
+                """이미지 한 장 처리 및 저장 (작업 스레드) -> (성공 여부, 로그 메시지)"""
                 try:
-                    # 이미지별 오프셋 확인
-                    img_path_str = str(image_path)
-                    if img_path_str in image_offsets:
-                        img_offset_x, img_offset_y = image_offsets[img_path_str]
-                    else:
-                        img_offset_x, img_offset_y = offset_x, offset_y
+                    img_offset_x, img_offset_y = img_offset
                     
                     # 이미지 처리 (메타데이터 포함, 개별 오프셋 적용)
                     result = cropper.process_image(
@@ -1182,54 +1760,77 @@ class PhotoCardCropperApp:
                         offset_y=img_offset_y
                     )
                     
-                    if result is not None:
-                        image_data, metadata = result
-                        
-                        # 메타데이터와 함께 저장
-                        saved_path = file_handler.save_image(
-                            image_data,
-                            original_path=str(image_path),
-                            metadata=metadata
-                        )
-                        
-                        if saved_path:
-                            success_count += 1
-                            # DPI 정보 표시
-                            dpi_info = f" (DPI: {metadata.get('dpi', (72,72))[0]})" if metadata else ""
-                            log_msg = f"✅ {image_path.name}{dpi_info}"
-                        else:
-                            fail_count += 1
-                            log_msg = f"❌ {image_path.name} - 저장 실패"
-                    else:
-                        fail_count += 1
-                        log_msg = f"⚠️ {image_path.name} - 얼굴 미감지"
+                    if result is None:
+                        return False, f"⚠️ {image_path.name} - 얼굴 미감지"
+                    
+                    image_data, metadata = result
+                    
+                    # 메타데이터와 함께 저장
+                    saved_path = file_handler.save_image(
+                        image_data,
+                        original_path=str(image_path),
+                        metadata=metadata
+                    )
+                    
+                    if not saved_path:
+                        return False, f"❌ {image_path.name} - 저장 실패"
+                    
+                    # DPI 정보 표시
+                    dpi_info = f" (DPI: {metadata.get('dpi', (72,72))[0]})" if metadata else ""
+                    return True, f"✅ {image_path.name}{dpi_info}"
                     
                 except Exception as e:
-                    fail_count += 1
-                    log_msg = f"❌ {image_path.name} - {str(e)}"
-                
-                # UI 업데이트 (메인 스레드에서)
-                progress = (idx / total) * 100
-                self.root.after(0, lambda p=progress, i=idx, t=total, m=log_msg: 
-                               self._update_progress(p, i, t, m))
+                    return False, f"❌ {image_path.name} - {str(e)}"
+            
+            def process_group(group: List[Tuple[Path, Tuple[float, float]]]) -> List[Tuple[bool, str]]:
+                """출력 경로가 같은 이미지들을 순서대로 처리 (작업 스레드)"""
+                return [process_one(image_path, img_offset) for image_path, img_offset in group]
+            
+            # 처리 루프 (OpenCV/Pillow 연산은 GIL을 해제하므로 스레드 풀로 병렬 처리)
+            success_count = 0
+            fail_count = 0
+            workers = min(total, os.cpu_count() or 1)
+            
+            # 이전 실행의 얼굴 감지 결과 재사용 (출력 폴더에 저장, 파일이 바뀌면 다시 감지)
+            face_cache_path = str(file_handler.output_dir / cropper.FACE_CACHE_FILENAME)
+            cropper.load_face_cache(face_cache_path)
+            
+            previous_threads = configure_threading(workers)
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(process_group, group) for group in groups]
+                    
+                    idx = 0
+                    for future in as_completed(futures):
+                        for ok, log_msg in future.result():
+                            idx += 1
+                            if ok:
+                                success_count += 1
+                            else:
+                                fail_count += 1
+                            
+                            # UI 업데이트는 로그 폴링 때 최신 값으로 한 번만 (이미지마다 Tk 이벤트를 만들지 않음)
+                            self._append_log(log_msg)
+                            self._pending_progress = (idx, total)
+            finally:
+                cv2.setNumThreads(previous_threads)
+                cropper.save_face_cache(face_cache_path)
             
             # 완료 메시지
-            self.root.after(0, lambda: self._append_log(
-                f"\n🎉 변환 완료! 성공: {success_count}, 실패: {fail_count}"
-            ))
+            self._append_log(f"\n🎉 변환 완료! 성공: {success_count}, 실패: {fail_count}")
             
         except Exception as e:
-            self.root.after(0, lambda: self._append_log(f"❌ 오류 발생: {str(e)}"))
+            self._append_log(f"❌ 오류 발생: {str(e)}")
         
         finally:
             self.root.after(0, self._processing_complete)
     
-    def _update_progress(self, progress: float, current: int, total: int, log_msg: str):
+    def _update_progress(self, current: int, total: int):
         """진행 상황 업데이트 (메인 스레드)"""
+        progress = (current / total) * 100
         self.progress_var.set(progress)
         percentage = int(progress)
         self.progress_label.configure(text=f"{current} / {total} ({percentage}%)")
-        self._append_log(log_msg)
     
     def _processing_complete(self):
         """처리 완료"""
@@ -1262,7 +1863,7 @@ def run_cli():
     """CLI 모드 실행"""
     import argparse
     
-    from core.cropper import PhotoCardCropper
+    from core.cropper import PhotoCardCropper, FaceDetector
     from utils.file_handler import FileHandler, BatchProcessor
     
     parser = argparse.ArgumentParser(
@@ -1292,6 +1893,14 @@ def run_cli():
     parser.add_argument('--offset-y', type=float, default=0.0, help='상하 오프셋 -0.3~0.3 (기본값: 0.0)')
     parser.add_argument('--format', '-f', type=str, choices=['jpg', 'png', 'webp', 'tiff'], default='jpg')
     parser.add_argument('--quality', '-q', type=int, default=100, help='출력 품질 (기본값: 100)')
+    parser.add_argument('--no-eye-detection', action='store_true', help='눈 감지 생략 (얼굴 비율로 눈 위치 추정)')
+    parser.add_argument('--opencl', action='store_true', help='OpenCL 지원 시 GPU로 얼굴 감지')
+    parser.add_argument(
+        '--scale-factor', type=float, default=FaceDetector.DEFAULT_SCALE_FACTOR,
+        help=f'얼굴 감지 피라미드 배율 (기본값: {FaceDetector.DEFAULT_SCALE_FACTOR})'
+    )
+    parser.add_argument('--equalize', action='store_true', help='얼굴 감지 전 히스토그램 평활화 (역광/저대비 사진)')
+    parser.add_argument('--no-face-cache', action='store_true', help='출력 폴더의 얼굴 감지 캐시(.face_cache.json) 사용 안 함')
     
     args = parser.parse_args()
     
@@ -1316,7 +1925,12 @@ def run_cli():
         height_mm=args.height,
         preserve_resolution=True,  # 원본 해상도 유지
         offset_x=args.offset_x,
-        offset_y=args.offset_y
+        offset_y=args.offset_y,
+        use_eye_detection=not args.no_eye_detection,
+        use_opencl=args.opencl,
+        scale_factor=args.scale_factor,
+        equalize_hist=args.equalize,
+        use_face_cache=not args.no_face_cache
     )
     
     if args.input:
@@ -0,0 +1,153 @@
+"""
+PhotoCardCropper 얼굴 감지 캐시(load_face_cache/save_face_cache) 테스트
+
+저장/불러오기 왕복, 설정·버전 불일치, 잘못된 항목, 파일 변경 시 재감지,
+삭제된 파일 항목 정리를 확인합니다.
+
+실행: python -m unittest discover -s tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.cropper import PhotoCardCropper  # noqa: E402
+
+FACE = (10, 20, 100, 120, (60, 60))
+
+
+class FaceCacheTest(unittest.TestCase):
+    """얼굴 감지 캐시 JSON 저장/불러오기와 재감지 조건 확인"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_path = os.path.join(self.tmp.name, PhotoCardCropper.FACE_CACHE_FILENAME)
+        self.image = np.zeros((8, 8, 3), dtype=np.uint8)
+        self.paths = [self._write_file(name) for name in ('a.jpg', 'b.jpg')]
+
+        # 실제 감지 대신 호출 횟수만 세는 가짜 감지기
+        patcher = mock.patch.object(PhotoCardCropper, '_detect_largest_face', return_value=FACE)
+        self.detect = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write_file(self, name: str, data: bytes = b'image') -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def _detect(self, cropper: PhotoCardCropper, path: str):
+        return cropper._detect_largest_face_cached(self.image, cropper._face_cache_key(path))
+
+    def _populated_cropper(self, **kwargs) -> PhotoCardCropper:
+        cropper = PhotoCardCropper(**kwargs)
+        self.detect.return_value = FACE
+        self._detect(cropper, self.paths[0])
+        self.detect.return_value = None  # 미감지 결과도 캐시됨
+        self._detect(cropper, self.paths[1])
+        self.detect.return_value = FACE
+        return cropper
+
+    def _read_json(self) -> dict:
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_json(self, data: dict):
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_round_trip(self):
+        cropper = self._populated_cropper()
+        self.assertTrue(cropper.save_face_cache(self.cache_path))
+
+        loaded = PhotoCardCropper()
+        self.assertEqual(loaded.load_face_cache(self.cache_path), 2)
+        self.assertEqual(loaded._face_cache, cropper._face_cache)
+
+        self.detect.reset_mock()
+        self.assertEqual(self._detect(loaded, self.paths[0]), FACE)
+        self.assertIsNone(self._detect(loaded, self.paths[1]))
+        self.detect.assert_not_called()
+
+    def test_settings_or_version_mismatch_is_ignored(self):
+        self._populated_cropper().save_face_cache(self.cache_path)
+
+        for kwargs in ({'scale_factor': 1.3}, {'equalize_hist': True}, {'use_eye_detection': False}):
+            with self.subTest(**kwargs):
+                cropper = PhotoCardCropper(**kwargs)
+                self.assertEqual(cropper.load_face_cache(self.cache_path), 0)
+                self.assertEqual(cropper._face_cache, {})
+
+        data = self._read_json()
+        data['version'] = PhotoCardCropper.FACE_CACHE_VERSION + 1
+        self._write_json(data)
+        cropper = PhotoCardCropper()
+        self.assertEqual(cropper.load_face_cache(self.cache_path), 0)
+        self.assertEqual(cropper._face_cache, {})
+
+    def test_malformed_late_entry_loads_nothing(self):
+        self._populated_cropper().save_face_cache(self.cache_path)
+        data = self._read_json()
+        data['entries']['zz_last.jpg'] = [1, 2, [1, 2, 3]]
+        self._write_json(data)
+
+        cropper = PhotoCardCropper()
+        self.assertEqual(cropper.load_face_cache(self.cache_path), 0)
+        self.assertEqual(cropper._face_cache, {})
+
+    def test_corrupt_json_loads_nothing(self):
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            f.write('{"version": 1, "entr')
+
+        cropper = PhotoCardCropper()
+        self.assertEqual(cropper.load_face_cache(self.cache_path), 0)
+        self.assertEqual(cropper._face_cache, {})
+
+    def test_changed_mtime_forces_redetection(self):
+        cropper = self._populated_cropper()
+        self.detect.reset_mock()
+
+        st = os.stat(self.paths[0])
+        os.utime(self.paths[0], ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self._detect(cropper, self.paths[0])
+        self.assertEqual(self.detect.call_count, 1)
+
+        self._detect(cropper, self.paths[0])
+        self.assertEqual(self.detect.call_count, 1)
+
+    def test_changed_size_forces_redetection(self):
+        cropper = self._populated_cropper()
+        self.detect.reset_mock()
+
+        st = os.stat(self.paths[0])
+        self._write_file('a.jpg', b'larger image')
+        os.utime(self.paths[0], ns=(st.st_atime_ns, st.st_mtime_ns))
+        self._detect(cropper, self.paths[0])
+        self.assertEqual(self.detect.call_count, 1)
+
+    def test_deleted_files_are_pruned_on_save(self):
+        cropper = self._populated_cropper()
+        os.remove(self.paths[1])
+
+        self.assertTrue(cropper.save_face_cache(self.cache_path))
+        entries = self._read_json()['entries']
+        self.assertEqual(list(entries), [os.path.abspath(self.paths[0])])
+        self.assertFalse(os.path.exists(f"{self.cache_path}.tmp"))
+
+    def test_disabled_cache_skips_files(self):
+        cropper = self._populated_cropper(use_face_cache=False)
+        self.assertEqual(cropper._face_cache, {})
+        self.assertFalse(cropper.save_face_cache(self.cache_path))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
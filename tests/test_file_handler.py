@@ -0,0 +1,137 @@
+"""
+FileHandler의 JPEG/PNG 헤더 직접 처리 회귀 테스트
+
+OpenCV 저장 경로의 DPI 패치(JFIF APP0, PNG pHYs)와 get_image_info_fast의 헤더 파서가
+Pillow가 읽는 값과 일치하는지 확인합니다.
+
+실행: python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.file_handler import FileHandler  # noqa: E402
+
+
+def _sample_image(height: int = 40, width: int = 30) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+
+
+def _strip_jfif(data: bytes) -> bytes:
+    """JPEG에서 JFIF APP0 세그먼트 제거"""
+    assert data[2:4] == b'\xff\xe0'
+    length = int.from_bytes(data[4:6], 'big')
+    return data[:2] + data[4 + length:]
+
+
+class WriteWithCv2DpiTest(unittest.TestCase):
+    """OpenCV로 저장한 파일의 DPI를 Pillow와 빠른 파서가 같게 읽는지 확인"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.image = _sample_image()
+
+    def _save(self, output_format: str, dpi) -> str:
+        handler = FileHandler(output_format=output_format)
+        path = handler.save_image(
+            self.image,
+            output_path=os.path.join(self.tmp.name, f"out.{output_format}"),
+            metadata={'dpi': dpi}
+        )
+        self.assertIsNotNone(path)
+        return path
+
+    def test_jpeg_density_round_trip(self):
+        for dpi, expected in (((300, 300), (300, 300)), ((96, 72), (96, 72)), ((72.5, 72.5), (73, 73))):
+            with self.subTest(dpi=dpi):
+                path = self._save('jpg', dpi)
+                with open(path, 'rb') as f:
+                    self.assertEqual(f.read(2), b'\xff\xd8')
+                with Image.open(path) as pil_image:
+                    self.assertEqual(pil_image.info['dpi'], expected)
+                    self.assertEqual(pil_image.size, (30, 40))
+                self.assertEqual(FileHandler.get_image_info_fast(path), FileHandler.get_image_info(path))
+
+    def test_png_phys_round_trip(self):
+        for dpi in ((300, 300), (96, 72), (72.5, 72.5)):
+            with self.subTest(dpi=dpi):
+                path = self._save('png', dpi)
+                with Image.open(path) as pil_image:
+                    pil_image.load()  # CRC 검증 포함 전체 디코딩
+                    self.assertEqual(pil_image.size, (30, 40))
+                    for read, wanted in zip(pil_image.info['dpi'], dpi):
+                        self.assertAlmostEqual(read, wanted, delta=0.02)
+                self.assertEqual(FileHandler.get_image_info_fast(path), FileHandler.get_image_info(path))
+
+                decoded = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_COLOR)
+                np.testing.assert_array_equal(decoded, self.image)
+
+
+class ImageInfoFastTest(unittest.TestCase):
+    """get_image_info_fast가 get_image_info와 같은 결과를 내는지 확인 (대체 경로 포함)"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.pil_image = Image.fromarray(_sample_image())
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.tmp.name, name)
+
+    def _assert_same_info(self, path: str):
+        fast = FileHandler.get_image_info_fast(path)
+        self.assertIsNotNone(fast)
+        self.assertEqual(fast, FileHandler.get_image_info(path))
+        return fast
+
+    def test_jpeg_without_jfif(self):
+        ok, buf = cv2.imencode('.jpg', _sample_image())
+        self.assertTrue(ok)
+        path = self._path('no_jfif.jpg')
+        with open(path, 'wb') as f:
+            f.write(_strip_jfif(buf.tobytes()))
+
+        info = self._assert_same_info(path)
+        self.assertEqual(info['dpi'], (72, 72))
+
+    def test_jpeg_with_exif_only_dpi_falls_back(self):
+        exif = Image.Exif()
+        exif[296] = 2  # ResolutionUnit: inch
+        exif[282] = 350.0  # XResolution
+        exif[283] = 350.0  # YResolution
+        path = self._path('exif.jpg')
+        self.pil_image.save(path, exif=exif.tobytes())
+
+        with open(path, 'rb') as f:
+            self.assertIsNone(FileHandler._read_header(f))
+        info = self._assert_same_info(path)
+        self.assertEqual(info['dpi'], (350.0, 350.0))
+
+    def test_png_without_phys(self):
+        path = self._path('plain.png')
+        self.pil_image.save(path)
+
+        info = self._assert_same_info(path)
+        self.assertEqual(info['dpi'], (72, 72))
+
+    def test_webp_falls_back(self):
+        path = self._path('image.webp')
+        self.pil_image.save(path)
+
+        with open(path, 'rb') as f:
+            self.assertIsNone(FileHandler._read_header(f))
+        self._assert_same_info(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,14 +6,18 @@ Pillow를 사용하여 DPI/메타데이터를 보존합니다.
 """
 
 import os
+import struct
+import zlib
 import cv2
 import numpy as np
 from PIL import Image
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Optional, Generator, Tuple, Dict, Any
 from datetime import datetime
 import logging
 import shutil
+import time
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -23,6 +27,18 @@ SUPPORTED_EXTENSIONS = {
     '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'
 }
 
+# 폴더 하나를 읽는 데 이보다 오래 걸리면 네트워크/외장 드라이브로 보고 병렬 탐색 (초)
+SLOW_SCANDIR_SECONDS = 0.005
+SCANDIR_MAX_WORKERS = 16
+
+# 축소 디코딩 배율별 imdecode 플래그 (JPEG는 디코더 내부에서 축소)
+REDUCED_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
 
 class FileHandler:
     """
@@ -80,22 +96,58 @@ class FileHandler:
             logger.error(f"디렉토리가 존재하지 않음: {search_dir}")
             return []
         
-        images = []
-        
-        if recursive:
-            for ext in SUPPORTED_EXTENSIONS:
-                images.extend(search_dir.rglob(f'*{ext}'))
-                images.extend(search_dir.rglob(f'*{ext.upper()}'))
-        else:
-            for ext in SUPPORTED_EXTENSIONS:
-                images.extend(search_dir.glob(f'*{ext}'))
-                images.extend(search_dir.glob(f'*{ext.upper()}'))
+        # 확장자별로 여러 번 탐색하지 않고 한 번만 순회 (DirEntry는 stat 정보를 캐시)
+        image_paths = []
+        pending = [str(search_dir)]
+        while pending:
+            current = pending.pop()
+            started = time.perf_counter()
+            files, subdirs = self._scan_directory(current)
+            image_paths.extend(files)
+            if recursive:
+                pending.extend(subdirs)
+            
+            # 로컬 디스크는 단일 순회가 가장 빠름. 느린 드라이브에서만 하위 폴더를 병렬로 읽어 지연을 겹침
+            if len(pending) > 1 and time.perf_counter() - started > SLOW_SCANDIR_SECONDS:
+                image_paths.extend(self._scan_parallel(pending))
+                break
         
-        images = sorted(set(images))
+        images = sorted(Path(p) for p in image_paths)
         logger.info(f"탐색 완료: {len(images)}개 이미지 발견 ({search_dir})")
         
         return images
     
+    @staticmethod
+    def _scan_directory(directory: str) -> Tuple[List[str], List[str]]:
+        """폴더 하나를 읽어 (이미지 파일 경로, 하위 폴더 경로) 반환"""
+        files, subdirs = [], []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS and entry.is_file():
+                            files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"디렉토리 탐색 실패 ({directory}): {e}")
+        return files, subdirs
+    
+    @classmethod
+    def _scan_parallel(cls, frontier: List[str]) -> List[str]:
+        """하위 폴더를 단계별(BFS)로 스레드 풀에서 동시에 읽기 (SMB/SSHFS 등 지연이 큰 드라이브용)"""
+        image_paths = []
+        with ThreadPoolExecutor(max_workers=SCANDIR_MAX_WORKERS) as executor:
+            while frontier:
+                next_frontier = []
+                for files, subdirs in executor.map(cls._scan_directory, frontier):
+                    image_paths.extend(files)
+                    next_frontier.extend(subdirs)
+                frontier = next_frontier
+        return image_paths
+    
     def iter_images(
         self,
         directory: Optional[str] = None,
@@ -122,6 +174,35 @@ class FileHandler:
             logger.error(f"이미지 로드 실패 ({file_path}): {str(e)}")
             return None
     
+    @staticmethod
+    def load_image_preview(file_path: str, scale: int = 2) -> Optional[np.ndarray]:
+        """
+        미리보기용 축소 로드 (1/scale 크기)
+        
+        JPEG는 디코더가 DCT 단계에서 바로 축소하므로 전체 디코딩 후 리사이즈보다
+        빠르고 메모리도 적게 씁니다. 저장용 처리는 load_image를 사용하세요.
+        
+        Args:
+            file_path: 이미지 파일 경로
+            scale: 축소 배율 (1, 2, 4, 8)
+        """
+        flag = REDUCED_DECODE_FLAGS.get(scale)
+        if flag is None:
+            raise ValueError(f"지원하지 않는 축소 배율: {scale}")
+        
+        try:
+            image = cv2.imdecode(np.fromfile(file_path, dtype=np.uint8), flag)
+            
+            if image is None:
+                logger.error(f"이미지 디코딩 실패: {file_path}")
+                return None
+            
+            return image
+            
+        except Exception as e:
+            logger.error(f"이미지 로드 실패 ({file_path}): {str(e)}")
+            return None
+    
     def save_image(
         self,
         image: np.ndarray,
@@ -182,22 +263,33 @@ class FileHandler:
             if save_path.suffix.lower() != ext:
                 save_path = save_path.with_suffix(ext)
             
-            # BGR -> RGB 변환 후 Pillow Image로 변환
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(image_rgb)
-            
-            # 저장 파라미터 설정
-            save_kwargs = {}
-            
             # DPI 설정
+            dpi = None
             if self.preserve_dpi and metadata and 'dpi' in metadata:
                 dpi = metadata['dpi']
                 # DPI가 튜플이 아닌 경우 처리
                 if isinstance(dpi, (int, float)):
                     dpi = (dpi, dpi)
-                save_kwargs['dpi'] = dpi
                 logger.info(f"DPI 보존: {dpi}")
             
+            # EXIF/ICC가 없으면 OpenCV로 바로 인코딩 (BGR -> RGB 변환 및 PIL 복사 생략)
+            # WebP는 OpenCV에 압축 노력(method) 설정이 없어 PIL의 method=6 결과를 유지하도록 PIL로 저장
+            if self.output_format in ('jpg', 'jpeg', 'png') and not (
+                metadata and (metadata.get('exif') or metadata.get('icc_profile'))
+            ):
+                if self._write_with_cv2(image, save_path, ext, dpi):
+                    logger.debug(f"이미지 저장 완료: {save_path}")
+                    return str(save_path)
+            
+            # Pillow가 BGR 버퍼를 읽으면서 바로 RGB로 변환 (중간 RGB 배열 할당 생략)
+            height, width = image.shape[:2]
+            pil_image = Image.frombytes('RGB', (width, height), np.ascontiguousarray(image), 'raw', 'BGR')
+            
+            # 저장 파라미터 설정
+            save_kwargs = {}
+            if dpi is not None:
+                save_kwargs['dpi'] = dpi
+            
             # 포맷별 품질 설정
             if self.output_format in ('jpg', 'jpeg'):
                 save_kwargs['quality'] = self.output_quality
@@ -233,6 +325,70 @@ class FileHandler:
             logger.error(f"이미지 저장 실패: {str(e)}")
             return None
     
+    def _write_with_cv2(
+        self,
+        image: np.ndarray,
+        save_path: Path,
+        ext: str,
+        dpi: Optional[Tuple[float, float]]
+    ) -> bool:
+        """
+        OpenCV로 JPEG/PNG 인코딩 후 저장 (PIL 경로와 같은 품질 설정)
+        
+        DPI는 JPEG는 JFIF APP0 밀도 값, PNG는 pHYs 청크로 직접 기록합니다.
+        
+        Returns:
+            성공 여부 (실패 시 호출 측에서 PIL로 저장)
+        """
+        if ext == '.jpg':
+            params = [
+                cv2.IMWRITE_JPEG_QUALITY, self.output_quality,
+                cv2.IMWRITE_JPEG_SAMPLING_FACTOR, cv2.IMWRITE_JPEG_SAMPLING_FACTOR_444
+            ]
+        else:
+            params = [cv2.IMWRITE_PNG_COMPRESSION, max(0, min(9, (100 - self.output_quality) // 10))]
+        
+        ok, buf = cv2.imencode(ext, image, params)
+        if not ok:
+            return False
+        
+        if dpi is not None:
+            x_dpi, y_dpi = (float(d) for d in dpi)
+            if ext == '.jpg':
+                buf = self._set_jfif_density(buf, int(x_dpi + 0.5), int(y_dpi + 0.5))
+            else:
+                buf = self._insert_png_phys(buf, int(x_dpi / 0.0254 + 0.5), int(y_dpi / 0.0254 + 0.5))
+            if buf is None:
+                return False
+        
+        # np.ndarray.tofile은 유니코드 경로도 지원
+        buf.tofile(str(save_path))
+        return True
+    
+    @staticmethod
+    def _set_jfif_density(buf: np.ndarray, x_dpi: int, y_dpi: int) -> Optional[np.ndarray]:
+        """JPEG 버퍼의 JFIF APP0 밀도 값을 DPI로 설정 (JFIF 헤더가 없으면 None)"""
+        # SOI(2) + APP0 마커(2) + 길이(2) + 'JFIF\0'(5) + 버전(2) + 단위(1) + X/Y 밀도(2+2)
+        if bytes(buf[2:4]) != b'\xff\xe0' or bytes(buf[6:11]) != b'JFIF\x00':
+            return None
+        if not (0 < x_dpi <= 0xFFFF and 0 < y_dpi <= 0xFFFF):
+            return None
+        buf[13] = 1  # 단위: inch
+        buf[14:18] = np.frombuffer(struct.pack('>HH', x_dpi, y_dpi), dtype=np.uint8)
+        return buf
+    
+    @staticmethod
+    def _insert_png_phys(buf: np.ndarray, x_ppm: int, y_ppm: int) -> Optional[np.ndarray]:
+        """PNG 버퍼의 IHDR 뒤에 pHYs 청크(미터당 픽셀 수) 삽입 (IHDR이 예상 위치에 없으면 None)"""
+        # 시그니처(8) + IHDR 청크(길이 4 + 타입 4 + 데이터 13 + CRC 4)
+        if bytes(buf[12:16]) != b'IHDR':
+            return None
+        if not (0 < x_ppm <= 0xFFFFFFFF and 0 < y_ppm <= 0xFFFFFFFF):
+            return None
+        body = b'pHYs' + struct.pack('>IIB', x_ppm, y_ppm, 1)
+        chunk = struct.pack('>I', 9) + body + struct.pack('>I', zlib.crc32(body))
+        return np.concatenate([buf[:33], np.frombuffer(chunk, dtype=np.uint8), buf[33:]])
+    
     def get_output_path(
         self,
         original_path: str,
@@ -255,6 +411,25 @@ class FileHandler:
         new_name = f"{original.stem}{suffix}.{self.output_format}"
         return str(save_dir / new_name)
     
+    def group_by_output_path(self, image_paths: List[Path]) -> List[List[Path]]:
+        """
+        출력 경로가 같은 입력끼리 묶기 (예: a.jpg와 a.png -> a_cropped.jpg)
+        
+        한 그룹은 한 작업 스레드에서 입력 순서대로 처리해야 같은 파일을 동시에 쓰지 않습니다.
+        대소문자를 구분하지 않는 파일 시스템(macOS/Windows)을 고려해 소문자로 비교합니다.
+        """
+        groups: Dict[str, List[Path]] = {}
+        for image_path in image_paths:
+            groups.setdefault(self.get_output_path(str(image_path)).lower(), []).append(image_path)
+        
+        for group in groups.values():
+            if len(group) > 1:
+                logger.warning(
+                    f"출력 파일 이름 충돌: {', '.join(p.name for p in group)} "
+                    f"-> {Path(self.get_output_path(str(group[-1]))).name} (순서대로 처리)"
+                )
+        return list(groups.values())
+    
     def create_backup(self, file_path: str) -> Optional[str]:
         try:
             original = Path(file_path)
@@ -281,12 +456,12 @@ class FileHandler:
             
             file_size = path.stat().st_size
             
-            # Pillow로 상세 정보 읽기
-            pil_image = Image.open(str(path))
-            width, height = pil_image.size
-            
-            # DPI 정보
-            dpi = pil_image.info.get('dpi', (72, 72))
+            # Pillow로 상세 정보 읽기 (헤더만 읽고 파일은 바로 닫음)
+            with Image.open(str(path)) as pil_image:
+                width, height = pil_image.size
+                
+                # DPI 정보
+                dpi = pil_image.info.get('dpi', (72, 72))
             
             return {
                 'path': str(path.absolute()),
@@ -302,6 +477,109 @@ class FileHandler:
         except Exception as e:
             logger.error(f"이미지 정보 조회 실패 ({file_path}): {str(e)}")
             return None
+    
+    @classmethod
+    def get_image_info_fast(cls, file_path: str) -> Optional[dict]:
+        """
+        get_image_info와 같은 정보를 JPEG/PNG는 헤더만 직접 읽어 반환
+        
+        헤더로 알 수 없는 경우(TIFF/WebP, EXIF에만 DPI가 있는 JPEG 등)는 get_image_info로 대체합니다.
+        """
+        try:
+            path = Path(file_path)
+            with open(path, 'rb') as f:
+                header = cls._read_header(f)
+            if header is None:
+                return cls.get_image_info(file_path)
+            
+            width, height, dpi = header
+            file_size = path.stat().st_size
+            return {
+                'path': str(path.absolute()),
+                'name': path.name,
+                'extension': path.suffix.lower(),
+                'width': width,
+                'height': height,
+                'dpi': dpi,
+                'file_size': file_size,
+                'file_size_mb': round(file_size / (1024 * 1024), 2)
+            }
+            
+        except (OSError, struct.error):
+            return cls.get_image_info(file_path)
+    
+    @classmethod
+    def _read_header(cls, f) -> Optional[Tuple[int, int, tuple]]:
+        """파일 헤더에서 (가로, 세로, DPI) 읽기 (지원하지 않는 형식이면 None)"""
+        signature = f.read(8)
+        if signature[:2] == b'\xff\xd8':
+            f.seek(2)
+            return cls._read_jpeg_header(f)
+        if signature == b'\x89PNG\r\n\x1a\n':
+            return cls._read_png_header(f)
+        return None
+    
+    @staticmethod
+    def _read_jpeg_header(f) -> Optional[Tuple[int, int, tuple]]:
+        """JPEG 마커를 건너뛰며 SOF에서 크기, JFIF APP0에서 DPI 읽기 (Pillow와 같은 규칙)"""
+        dpi = None
+        has_exif = False
+        while True:
+            marker = f.read(4)
+            # 채움 바이트 등 예상과 다른 구조는 Pillow에 맡김
+            if len(marker) < 4 or marker[0] != 0xFF or marker[1] == 0xFF:
+                return None
+            code = marker[1]
+            length = struct.unpack('>H', marker[2:])[0]
+            if length < 2:
+                return None
+            
+            # SOF0 ~ SOF15 (DHT/JPG/DAC 제외): 정밀도(1) + 세로(2) + 가로(2)
+            if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>xHH', f.read(5))
+                if dpi is None:
+                    # EXIF에만 DPI가 있을 수 있으므로 Pillow로 확인
+                    if has_exif:
+                        return None
+                    dpi = (72, 72)
+                return width, height, dpi
+            
+            segment = f.read(length - 2)
+            if code == 0xE0 and segment[:5] == b'JFIF\x00' and len(segment) >= 12:
+                unit, x_density, y_density = struct.unpack('>BHH', segment[7:12])
+                if unit == 1:
+                    dpi = (x_density, y_density)
+                elif unit == 2:
+                    dpi = (x_density * 2.54, y_density * 2.54)
+            elif code == 0xE1 and segment[:6] == b'Exif\x00\x00':
+                has_exif = True
+            elif code == 0xDA:
+                return None
+    
+    @staticmethod
+    def _read_png_header(f) -> Optional[Tuple[int, int, tuple]]:
+        """PNG IHDR에서 크기, IDAT 전 pHYs 청크에서 DPI 읽기 (데이터는 건너뜀)"""
+        length, chunk_type = struct.unpack('>I4s', f.read(8))
+        if chunk_type != b'IHDR':
+            return None
+        width, height = struct.unpack('>II', f.read(8))
+        f.seek(length - 8 + 4, os.SEEK_CUR)  # 나머지 IHDR 데이터 + CRC
+        
+        dpi = (72, 72)
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                break
+            length, chunk_type = struct.unpack('>I4s', chunk)
+            if chunk_type in (b'IDAT', b'IEND'):
+                break
+            if chunk_type == b'pHYs':
+                x_ppm, y_ppm, unit = struct.unpack('>IIB', f.read(9))
+                if unit == 1:
+                    dpi = (x_ppm * 0.0254, y_ppm * 0.0254)
+                break
+            f.seek(length + 4, os.SEEK_CUR)  # 데이터 + CRC
+        return width, height, dpi
 
 
 class BatchProcessor:
@@ -332,12 +610,66 @@ class BatchProcessor:
             'skipped': 0
         }
     
+    def _process_one(self, image_path: Path) -> Tuple[str, str]:
+        """
+        이미지 한 장 처리 및 저장 (작업 스레드)
+        
+        Returns:
+            (결과 상태 'success'/'failed'/'skipped', 로그 메시지)
+        """
+        try:
+            output_path = self.file_handler.get_output_path(str(image_path))
+            
+            if self.skip_existing and Path(output_path).exists():
+                return 'skipped', f"건너뛰기 (이미 존재): {image_path.name}"
+            
+            # 이미지 처리 (메타데이터 포함)
+            result = self.cropper.process_image(str(image_path))
+            
+            if result is None:
+                return 'failed', f"처리 실패: {image_path.name}"
+            
+            image_data, metadata = result
+            
+            # 메타데이터와 함께 저장
+            saved_path = self.file_handler.save_image(
+                image_data,
+                original_path=str(image_path),
+                metadata=metadata
+            )
+            
+            if saved_path:
+                return 'success', f"완료: {image_path.name}"
+            return 'failed', f"저장 실패: {image_path.name}"
+            
+        except Exception as e:
+            return 'failed', f"예외 발생 ({image_path.name}): {str(e)}"
+    
+    def _process_group(self, image_paths: List[Path]) -> List[Tuple[Path, str, str]]:
+        """출력 경로가 같은 이미지들을 순서대로 처리 (작업 스레드) -> [(경로, 상태, 메시지)]"""
+        return [(image_path, *self._process_one(image_path)) for image_path in image_paths]
+    
     def process_batch(
         self,
         input_dir: Optional[str] = None,
         recursive: bool = True,
-        progress_callback=None
+        progress_callback=None,
+        max_workers: Optional[int] = None
     ) -> dict:
+        """
+        폴더 내 이미지 일괄 처리 (스레드 풀 병렬 처리)
+        
+        Args:
+            input_dir: 입력 디렉토리 (기본값: file_handler.input_dir)
+            recursive: 하위 폴더 포함 여부
+            progress_callback: (완료 수, 전체 수, 이미지 경로)를 받는 콜백 (완료 순서대로 호출)
+            max_workers: 작업 스레드 수 (기본값: CPU 코어 수)
+            
+        Returns:
+            처리 통계 딕셔너리
+        """
+        from core.cropper import configure_threading
+        
         self.reset_stats()
         
         images = self.file_handler.find_images(input_dir, recursive)
@@ -347,46 +679,43 @@ class BatchProcessor:
             logger.warning("처리할 이미지가 없습니다.")
             return self.stats
         
-        logger.info(f"배치 처리 시작: 총 {len(images)}개 이미지")
+        workers = min(len(images), max_workers or os.cpu_count() or 1)
+        logger.info(f"배치 처리 시작: 총 {len(images)}개 이미지, {workers}개 스레드")
         
-        for idx, image_path in enumerate(images, 1):
-            try:
-                if progress_callback:
-                    progress_callback(idx, len(images), str(image_path))
-                
-                output_path = self.file_handler.get_output_path(str(image_path))
-                
-                if self.skip_existing and Path(output_path).exists():
-                    logger.debug(f"건너뛰기 (이미 존재): {image_path.name}")
-                    self.stats['skipped'] += 1
-                    continue
-                
-                # 이미지 처리 (메타데이터 포함)
-                result = self.cropper.process_image(str(image_path))
+        # 이전 실행의 얼굴 감지 결과 재사용 (출력 폴더에 저장)
+        face_cache_path = None
+        if self.file_handler.output_dir and self.cropper.use_face_cache:
+            face_cache_path = str(self.file_handler.output_dir / self.cropper.FACE_CACHE_FILENAME)
+            self.cropper.load_face_cache(face_cache_path)
+        
+        previous_threads = configure_threading(workers)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # 출력 경로가 같은 입력은 한 작업으로 묶어 순서대로 처리 (같은 파일 동시 쓰기 방지)
+                futures = [
+                    executor.submit(self._process_group, group)
+                    for group in self.file_handler.group_by_output_path(images)
+                ]
                 
-                if result is not None:
-                    image_data, metadata = result
-                    
-                    # 메타데이터와 함께 저장
-                    saved_path = self.file_handler.save_image(
-                        image_data,
-                        original_path=str(image_path),
-                        metadata=metadata
-                    )
-                    
-                    if saved_path:
-                        self.stats['success'] += 1
-                        logger.info(f"[{idx}/{len(images)}] 완료: {image_path.name}")
-                    else:
-                        self.stats['failed'] += 1
-                        logger.error(f"[{idx}/{len(images)}] 저장 실패: {image_path.name}")
-                else:
-                    self.stats['failed'] += 1
-                    logger.error(f"[{idx}/{len(images)}] 처리 실패: {image_path.name}")
-                    
-            except Exception as e:
-                self.stats['failed'] += 1
-                logger.error(f"[{idx}/{len(images)}] 예외 발생 ({image_path.name}): {str(e)}")
+                idx = 0
+                for future in as_completed(futures):
+                    for image_path, status, message in future.result():
+                        idx += 1
+                        self.stats[status] += 1
+                        
+                        if status == 'success':
+                            logger.info(f"[{idx}/{len(images)}] {message}")
+                        elif status == 'skipped':
+                            logger.debug(message)
+                        else:
+                            logger.error(f"[{idx}/{len(images)}] {message}")
+                        
+                        if progress_callback:
+                            progress_callback(idx, len(images), str(image_path))
+        finally:
+            cv2.setNumThreads(previous_threads)
+            if face_cache_path:
+                self.cropper.save_face_cache(face_cache_path)
         
         logger.info(
             f"배치 처리 완료 - "